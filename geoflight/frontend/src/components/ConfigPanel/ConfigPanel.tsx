@@ -1,5 +1,6 @@
 import { useState, useMemo } from 'react';
 import type { MissionConfig, FlightParams, DroneModel, FlightPattern, FinishAction, SimplificationStats, Waypoint } from '../../types';
+import { CAMERA_PRESETS } from '../../types';
 import './ConfigPanel.css';
 
 interface ConfigPanelProps {
@@ -46,10 +47,10 @@ function calculateTotalDistance(waypoints: Waypoint[]): number {
   return total;
 }
 
-const DRONE_OPTIONS: { value: DroneModel; label: string }[] = [
-  { value: 'mini_5_pro', label: 'DJI Mini 5 Pro' },
-  { value: 'mini_4_pro', label: 'DJI Mini 4 Pro' },
-];
+// Built once at module load from the static camera presets (newest drone first)
+const DRONE_OPTIONS: { value: DroneModel; label: string }[] = (
+  ['mini_5_pro', 'mini_4_pro'] as DroneModel[]
+).map(value => ({ value, label: CAMERA_PRESETS[value].name }));
 
 const PATTERN_OPTIONS: { value: FlightPattern; label: string; icon: string }[] = [
   { value: 'grid', label: 'Grid', icon: '▤' },
@@ -42,6 +42,11 @@ export function useMission(): UseMissionReturn {
   const [validationErrors, setValidationErrors] = useState<string[]>([]);
   const [simplificationStats, setSimplificationStats] = useState<SimplificationStats | null>(null);
 
+  // Spin up the mission worker while the user is still drawing
+  useEffect(() => {
+    getWorkerClient().warmUp();
+  }, []);
+
   // Validate configuration
   useEffect(() => {
     const errors: string[] = [];
@@ -21,46 +21,77 @@ export interface CalculateParams {
 }
 
 /**
- * Calculate flight altitude from target GSD.
- * Formula: altitude = (GSD * focal_length * image_width) / (sensor_width * 100)
+ * Per-drone photogrammetry helpers bound to a single camera.
  */
-function gsdToAltitude(gsdCm: number, camera: CameraSpec): number {
-  return (gsdCm * camera.focal_length_mm * camera.image_width_px) / (camera.sensor_width_mm * 100);
+export interface PhotogrammetryCalculator {
+  camera: CameraSpec;
+  /** Default photo interval (s) per capture mode: [12MP, 48/50MP]. */
+  photoIntervals: readonly [number, number];
+  /** Flight altitude (m) for a target GSD (cm/px). */
+  gsdToAltitude: (gsdCm: number) => number;
+  /** GSD (cm/px) at a flight altitude (m). */
+  altitudeToGsd: (altitudeM: number) => number;
+  /** Ground footprint (m) of a single photo. */
+  calculateFootprint: (altitudeM: number) => { width: number; height: number };
+  /** Photo and line spacing (m) for the requested overlaps. */
+  calculateSpacing: (
+    altitudeM: number,
+    frontOverlapPct: number,
+    sideOverlapPct: number
+  ) => { photoSpacing: number; lineSpacing: number };
 }
 
-/**
- * Calculate GSD from flight altitude.
- * Formula: GSD = (sensor_width * altitude * 100) / (focal_length * image_width)
- */
-function altitudeToGsd(altitudeM: number, camera: CameraSpec): number {
-  return (camera.sensor_width_mm * altitudeM * 100) / (camera.focal_length_mm * camera.image_width_px);
+function createCalculator(camera: CameraSpec): PhotogrammetryCalculator {
+  // Camera-derived ratios, computed once so each formula is a single multiply.
+  // altitude = (GSD * focal_length * image_width) / (sensor_width * 100)
+  const gsdToAltK = (camera.focal_length_mm * camera.image_width_px) / (camera.sensor_width_mm * 100);
+  // GSD = (sensor_width * altitude * 100) / (focal_length * image_width)
+  const altToGsdK = 1 / gsdToAltK;
+  // dimension = (sensor_size / focal_length) * altitude
+  const footprintWidthK = camera.sensor_width_mm / camera.focal_length_mm;
+  const footprintHeightK = camera.sensor_height_mm / camera.focal_length_mm;
+
+  return {
+    camera,
+    photoIntervals: [camera.min_interval_12mp, camera.min_interval_48mp],
+    gsdToAltitude: (gsdCm: number): number => gsdCm * gsdToAltK,
+    altitudeToGsd: (altitudeM: number): number => altitudeM * altToGsdK,
+    calculateFootprint: (altitudeM: number) => ({
+      width: footprintWidthK * altitudeM,
+      height: footprintHeightK * altitudeM,
+    }),
+    calculateSpacing: (altitudeM: number, frontOverlapPct: number, sideOverlapPct: number) => ({
+      photoSpacing: footprintHeightK * altitudeM * (1 - frontOverlapPct / 100),
+      lineSpacing: footprintWidthK * altitudeM * (1 - sideOverlapPct / 100),
+    }),
+  };
 }
 
+// Camera presets are static, so one calculator per drone model is enough
+const calculatorCache = new Map<DroneModel, PhotogrammetryCalculator>();
+
 /**
- * Calculate ground footprint dimensions.
- * Formula: dimension = (sensor_size / focal_length) * altitude
+ * Get the (cached) calculator for a drone model.
  */
-function calculateFootprint(altitudeM: number, camera: CameraSpec): { width: number; height: number } {
-  return {
-    width: (camera.sensor_width_mm / camera.focal_length_mm) * altitudeM,
-    height: (camera.sensor_height_mm / camera.focal_length_mm) * altitudeM,
-  };
+export function getCalculator(droneModel: DroneModel): PhotogrammetryCalculator {
+  let calculator = calculatorCache.get(droneModel);
+  if (!calculator) {
+    calculator = createCalculator(CAMERA_PRESETS[droneModel]);
+    calculatorCache.set(droneModel, calculator);
+  }
+  return calculator;
 }
 
 /**
- * Calculate photo and line spacing from overlap requirements.
+ * Photo interval: use custom if in timer mode, otherwise use camera default.
  */
-function calculateSpacing(
-  altitudeM: number,
-  frontOverlapPct: number,
-  sideOverlapPct: number,
-  camera: CameraSpec
-): { photoSpacing: number; lineSpacing: number } {
-  const footprint = calculateFootprint(altitudeM, camera);
-  return {
-    photoSpacing: footprint.height * (1 - frontOverlapPct / 100),
-    lineSpacing: footprint.width * (1 - sideOverlapPct / 100),
-  };
+export function resolveInterval(
+  params: Pick<CalculateParams, 'use48mp' | 'useTimerMode' | 'photoIntervalS'>,
+  calculator: PhotogrammetryCalculator
+): number {
+  return (params.useTimerMode && params.photoIntervalS)
+    ? params.photoIntervalS
+    : calculator.photoIntervals[params.use48mp ? 1 : 0];
 }
 
 /**
@@ -68,29 +99,30 @@ function calculateSpacing(
  * This replaces the /api/calculate endpoint.
  */
 export function calculateFlightParams(params: CalculateParams): FlightParams {
-  const camera = CAMERA_PRESETS[params.droneModel];
+  const calculator = getCalculator(params.droneModel);
+  return computeFlightParams(params, calculator, resolveInterval(params, calculator));
+}
 
+function computeFlightParams(
+  params: CalculateParams,
+  calculator: PhotogrammetryCalculator,
+  interval: number
+): FlightParams {
   // Calculate altitude (use override if provided)
   let altitude: number;
   let actualGsd: number;
 
   if (params.altitudeOverrideM !== undefined) {
     altitude = params.altitudeOverrideM;
-    actualGsd = altitudeToGsd(altitude, camera);
+    actualGsd = calculator.altitudeToGsd(altitude);
   } else {
-    altitude = gsdToAltitude(params.targetGsdCm, camera);
-    actualGsd = altitudeToGsd(altitude, camera);
+    altitude = calculator.gsdToAltitude(params.targetGsdCm);
+    actualGsd = calculator.altitudeToGsd(altitude);
   }
 
   // Calculate footprint and spacing for desired overlap
-  const footprint = calculateFootprint(altitude, camera);
-  const spacing = calculateSpacing(altitude, params.frontOverlapPct, params.sideOverlapPct, camera);
-
-  // Photo interval: use custom if in timer mode, otherwise use camera default
-  const defaultInterval = params.use48mp ? camera.min_interval_48mp : camera.min_interval_12mp;
-  const interval = (params.useTimerMode && params.photoIntervalS)
-    ? params.photoIntervalS
-    : defaultInterval;
+  const footprint = calculator.calculateFootprint(altitude);
+  const spacing = calculator.calculateSpacing(altitude, params.frontOverlapPct, params.sideOverlapPct);
 
   // Speed needed to achieve desired overlap with current interval
   const speedForDesiredOverlap = spacing.photoSpacing / interval;
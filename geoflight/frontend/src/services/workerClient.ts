@@ -71,6 +71,14 @@ class MissionWorkerClient {
     return this.worker;
   }
 
+  /**
+   * Start the worker ahead of the first request, so loading the worker bundle
+   * (proj4, JSZip, patterns) does not delay the first generation.
+   */
+  warmUp(): void {
+    this.getWorker();
+  }
+
   /**
    * Generate a unique request ID.
    */
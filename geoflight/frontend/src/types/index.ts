@@ -102,6 +102,8 @@ export interface SimplificationOptions {
   angle_threshold_deg: number;
   max_time_between_s?: number;
   max_distance_between_m?: number;
+  // Spatial tolerance (m): simplify by shape (Douglas-Peucker) instead of heading changes
+  tolerance_m?: number;
 }
 
 export interface SimplificationStats {
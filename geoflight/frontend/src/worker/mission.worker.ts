@@ -15,6 +15,7 @@ import type {
   SimplificationStats,
 } from '../types';
 import { CAMERA_PRESETS } from '../types';
+import { getCalculator, resolveInterval } from '../services/calculator';
 
 // Services
 import { simplifyWaypoints } from './services/waypointSimplifier';
@@ -32,7 +33,7 @@ import type { PatternGeneratorConfig } from './patterns/basePattern';
  * Mirrors the logic from services/calculator.ts - INCLUDING TIMER MODE
  */
 function calculateFlightParams(request: MissionRequest): FlightParams {
-  const camera = CAMERA_PRESETS[request.drone_model];
+  const calculator = getCalculator(request.drone_model);
 
   // Calculate altitude from GSD or use override
   let altitude: number;
@@ -40,29 +41,33 @@ function calculateFlightParams(request: MissionRequest): FlightParams {
   if (request.altitude_override_m !== undefined) {
     altitude = request.altitude_override_m;
   } else {
-    altitude = (request.target_gsd_cm * camera.focal_length_mm * camera.image_width_px) /
-      (camera.sensor_width_mm * 100);
+    altitude = calculator.gsdToAltitude(request.target_gsd_cm);
   }
 
   // ALWAYS recalculate actual GSD from the final altitude (matches Python backend)
-  const actualGsd = (camera.sensor_width_mm * altitude * 100) /
-    (camera.focal_length_mm * camera.image_width_px);
+  const actualGsd = calculator.altitudeToGsd(altitude);
 
   // Calculate footprint
-  const footprintWidth = (camera.sensor_width_mm / camera.focal_length_mm) * altitude;
-  const footprintHeight = (camera.sensor_height_mm / camera.focal_length_mm) * altitude;
+  const footprint = calculator.calculateFootprint(altitude);
+  const footprintWidth = footprint.width;
+  const footprintHeight = footprint.height;
 
   // Calculate spacing for desired overlap
-  const photoSpacing = footprintHeight * (1 - request.front_overlap_pct / 100);
-  const lineSpacing = footprintWidth * (1 - request.side_overlap_pct / 100);
+  const { photoSpacing, lineSpacing } = calculator.calculateSpacing(
+    altitude,
+    request.front_overlap_pct,
+    request.side_overlap_pct
+  );
 
   // Photo interval: use custom if in timer mode, otherwise use camera default
-  const defaultInterval = request.use_48mp
-    ? camera.min_interval_48mp
-    : camera.min_interval_12mp;
-  const interval = (request.use_timer_mode && request.photo_interval_s)
-    ? request.photo_interval_s
-    : defaultInterval;
+  const interval = resolveInterval(
+    {
+      use48mp: request.use_48mp,
+      useTimerMode: request.use_timer_mode,
+      photoIntervalS: request.photo_interval_s,
+    },
+    calculator
+  );
 
   // Speed needed to achieve desired overlap with current interval
   const speedForDesiredOverlap = photoSpacing / interval;
@@ -238,17 +243,39 @@ function generateWaypoints(
   return { waypoints, warnings };
 }
 
-/**
- * Handle GENERATE_WAYPOINTS request.
- */
-async function handleGenerateWaypoints(
-  request: MissionRequest
-): Promise<{
+interface MissionBuild {
   waypoints: Waypoint[];
   flightParams: FlightParams;
   warnings: string[];
   simplificationStats?: SimplificationStats;
-}> {
+  // Packager for this mission, created on the first KMZ export
+  packager?: KMZPackager;
+}
+
+// Last built mission. Downloading a KMZ right after previewing the same
+// mission reuses it instead of generating (and simplifying) everything again.
+let lastMission: { key: string; build: MissionBuild } | null = null;
+
+/**
+ * Build the mission for a request, reusing the previous build when the request
+ * only differs in fields that do not affect waypoints (finish_action).
+ */
+function getMission(request: MissionRequest): MissionBuild {
+  const key = JSON.stringify({ ...request, finish_action: undefined });
+  if (lastMission?.key === key) {
+    console.log('[Worker] Reusing previously generated mission');
+    return lastMission.build;
+  }
+
+  const build = buildMission(request);
+  lastMission = { key, build };
+  return build;
+}
+
+/**
+ * Validate the request, calculate flight params, generate and simplify waypoints.
+ */
+function buildMission(request: MissionRequest): MissionBuild {
   const warnings: string[] = [];
 
   // Validate request
@@ -279,6 +306,7 @@ async function handleGenerateWaypoints(
       maxTimeBetweenS: request.simplify.max_time_between_s,
       maxDistanceBetweenM: request.simplify.max_distance_between_m,
       speedMs: flightParams.max_speed_ms,
+      toleranceM: request.simplify.tolerance_m,
     });
     waypoints = simplified.waypoints;
     simplificationStats = simplified.stats;
@@ -307,35 +335,36 @@ async function handleGenerateWaypoints(
   };
 }
 
+/**
+ * Handle GENERATE_WAYPOINTS request.
+ */
+async function handleGenerateWaypoints(request: MissionRequest): Promise<MissionBuild> {
+  return getMission(request);
+}
+
 /**
  * Handle GENERATE_KMZ request.
  */
 async function handleGenerateKmz(
   request: MissionRequest
-): Promise<{
-  kmzBlob: Blob;
-  waypoints: Waypoint[];
-  flightParams: FlightParams;
-  warnings: string[];
-  simplificationStats?: SimplificationStats;
-}> {
-  // First generate waypoints
-  const result = await handleGenerateWaypoints(request);
-
-  // Create KMZ
-  const packager = new KMZPackager(
-    request.drone_model,
-    result.waypoints
-  );
+): Promise<{ kmzBlob: Blob; warnings: string[] }> {
+  // Generate waypoints (or reuse the mission just previewed)
+  const result = getMission(request);
+
+  // Create KMZ. A reused mission keeps its packager, so exporting it again
+  // (e.g. with another finish action) only rebuilds template.kml
+  if (!result.packager) {
+    result.packager = new KMZPackager(
+      request.drone_model,
+      result.waypoints
+    );
+  }
 
-  const kmzBlob = await packager.createKmz(request.finish_action);
+  const kmzBlob = await result.packager.createKmz(request.finish_action);
 
   return {
     kmzBlob,
-    waypoints: result.waypoints,
-    flightParams: result.flightParams,
     warnings: result.warnings,
-    simplificationStats: result.simplificationStats,
   };
 }
 
@@ -367,15 +396,14 @@ self.onmessage = async (event: MessageEvent<WorkerRequest>) => {
 
       case 'GENERATE_KMZ': {
         const result = await handleGenerateKmz(payload);
+        // Only the blob is consumed on this path; skip structured-cloning
+        // the (possibly large) waypoint list back to the main thread.
         response = {
           id,
           type,
           success: true,
           data: {
-            waypoints: result.waypoints,
-            flightParams: result.flightParams,
             warnings: result.warnings,
-            simplificationStats: result.simplificationStats,
             kmzBlob: result.kmzBlob,
           },
         };
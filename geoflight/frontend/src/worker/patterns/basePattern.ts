@@ -6,10 +6,12 @@
 import type { Waypoint, FlightParams, Coordinate } from '../../types';
 import {
   createTransformer,
+  coordsToUtm,
+  coordsToWgs84,
   calculateCenter,
-  calculateHeading,
   type CoordinateTransformer,
 } from '../services/coordinateTransformer';
+import { sampleLines } from '../services/lineSampler';
 
 export interface PatternGeneratorConfig {
   flightParams: FlightParams;
@@ -22,11 +24,16 @@ export abstract class PatternGenerator {
   protected flightAngleDeg: number;
   protected gimbalPitchDeg: number;
   protected transformer: CoordinateTransformer | null = null;
+  // Per-waypoint constants, read once when the generator is built
+  private readonly waypointAltitude: number;
+  private readonly waypointSpeed: number;
 
   constructor(config: PatternGeneratorConfig) {
     this.flightParams = config.flightParams;
     this.flightAngleDeg = config.flightAngleDeg;
     this.gimbalPitchDeg = config.gimbalPitchDeg;
+    this.waypointAltitude = config.flightParams.altitude_m;
+    this.waypointSpeed = config.flightParams.max_speed_ms;
   }
 
   /**
@@ -44,7 +51,7 @@ export abstract class PatternGenerator {
     if (!this.transformer) {
       throw new Error('Transformers not initialized');
     }
-    return coords.map(c => this.transformer!.toUtm(c.longitude, c.latitude));
+    return coordsToUtm(coords, this.transformer);
   }
 
   /**
@@ -54,38 +61,54 @@ export abstract class PatternGenerator {
     if (!this.transformer) {
       throw new Error('Transformers not initialized');
     }
-    return coords.map(([x, y]) => this.transformer!.toWgs84(x, y));
+    return coordsToWgs84(coords, this.transformer);
   }
 
   /**
-   * Calculate heading between two UTM points in degrees (0-360).
+   * Sample photo waypoints along UTM flight lines at the configured photo spacing.
    */
-  protected calculateHeading(from: [number, number], to: [number, number]): number {
-    return calculateHeading(from, to);
+  protected linesToWaypoints(lines: [number, number][][]): Waypoint[] {
+    const { xs, ys, headings } = sampleLines(lines, this.flightParams.photo_spacing_m);
+    return this.samplesToWaypoints(xs, ys, headings);
   }
 
   /**
-   * Create a waypoint with standard parameters.
+   * Convert struct-of-arrays UTM samples into WGS84 waypoints (indexed in order).
    */
-  protected createWaypoint(
-    index: number,
-    lon: number,
-    lat: number,
-    heading: number = 0,
-    gimbalPitch?: number,
-    takePhoto: boolean = true
-  ): Waypoint {
-    const pitch = gimbalPitch ?? this.gimbalPitchDeg;
-    return {
-      index,
-      longitude: lon,
-      latitude: lat,
-      altitude: this.flightParams.altitude_m,
-      heading,
-      gimbal_pitch: pitch,
-      speed: this.flightParams.max_speed_ms,
-      take_photo: takePhoto,
-    };
+  protected samplesToWaypoints(
+    xs: Float64Array,
+    ys: Float64Array,
+    headings: Float64Array
+  ): Waypoint[] {
+    if (!this.transformer) {
+      throw new Error('Transformers not initialized');
+    }
+    // Project every sample in a single batch, then build the waypoints
+    const { lons, lats } = this.transformer.toWgs84Batch(xs, ys);
+    const n = xs.length;
+    const waypoints: Waypoint[] = new Array(n);
+
+    // Hot loop: shared fields are read into locals once. Generated values are
+    // trusted: no per-waypoint validation here, the worker checks the finished
+    // list once (see generateWaypoints).
+    const altitude = this.waypointAltitude;
+    const gimbalPitch = this.gimbalPitchDeg;
+    const speed = this.waypointSpeed;
+
+    for (let i = 0; i < n; i++) {
+      waypoints[i] = {
+        index: i,
+        longitude: lons[i],
+        latitude: lats[i],
+        altitude,
+        heading: headings[i],
+        gimbal_pitch: gimbalPitch,
+        speed,
+        take_photo: true,
+      };
+    }
+
+    return waypoints;
   }
 
   /**
@@ -0,0 +1,103 @@
+/**
+ * Tests for CorridorPatternGenerator
+ */
+
+import { describe, it, expect } from 'vitest';
+import { CorridorPatternGenerator, thinPolyline } from './corridorPattern';
+import type { FlightParams, Coordinate } from '../../types';
+
+// Test flight params
+const createFlightParams = (overrides?: Partial<FlightParams>): FlightParams => ({
+  altitude_m: 60,
+  gsd_cm_px: 2.0,
+  footprint_width_m: 85.6,
+  footprint_height_m: 64.2,
+  line_spacing_m: 30,
+  photo_spacing_m: 16,
+  max_speed_ms: 8.0,
+  photo_interval_s: 2.0,
+  estimated_photos: 0,
+  estimated_flight_time_min: 0,
+  ...overrides,
+});
+
+// Helper to create a UTM polyline with a vertex every `step` meters along x,
+// wobbling by up to `jitter` meters in y
+const createDenseLine = (lengthM: number, step: number, jitter: number = 0): [number, number][] => {
+  const line: [number, number][] = [];
+  for (let i = 0; i * step <= lengthM; i++) {
+    line.push([i * step, i % 2 === 0 ? 0 : jitter]);
+  }
+  return line;
+};
+
+describe('thinPolyline', () => {
+  it('should thin a dense, nearly straight centerline', () => {
+    const line = createDenseLine(100, 0.5, 0.1);
+    const thinned = thinPolyline(line, 3);
+
+    // One vertex every ~3m instead of every 0.5m
+    expect(line.length).toBe(201);
+    expect(thinned.length).toBeLessThan(40);
+    for (let i = 1; i < thinned.length - 1; i++) {
+      const dx = thinned[i][0] - thinned[i - 1][0];
+      const dy = thinned[i][1] - thinned[i - 1][1];
+      expect(Math.hypot(dx, dy)).toBeGreaterThanOrEqual(3);
+    }
+  });
+
+  it('should keep a bend larger than the tolerance', () => {
+    // 50m east, then 50m north
+    const line: [number, number][] = [[0, 0], [50, 0], [50, 50], [100, 50]];
+
+    expect(thinPolyline(line, 3)).toEqual(line);
+  });
+
+  it('should keep a vertex near the corner of a dense bend', () => {
+    const east = createDenseLine(50, 0.5);
+    const north = createDenseLine(50, 0.5).slice(1).map(([x]): [number, number] => [50, x]);
+    const thinned = thinPolyline([...east, ...north], 3);
+
+    // Some kept vertex stays within the tolerance of the corner at (50, 0)
+    const nearCorner = thinned.some(([x, y]) => Math.hypot(x - 50, y) <= 3);
+    expect(nearCorner).toBe(true);
+    expect(thinned[thinned.length - 1]).toEqual([50, 50]);
+  });
+
+  it('should always keep the first and last vertices', () => {
+    const line: [number, number][] = [[0, 0], [0.1, 0], [0.2, 0], [0.3, 0]];
+    const thinned = thinPolyline(line, 3);
+
+    expect(thinned).toHaveLength(2);
+    expect(thinned[0]).toBe(line[0]);
+    expect(thinned[1]).toBe(line[3]);
+
+    // A last vertex closer than the tolerance to the previous kept one stays too
+    const tail: [number, number][] = [[0, 0], [10, 0], [10.5, 0]];
+    expect(thinPolyline(tail, 3)).toEqual(tail);
+  });
+});
+
+describe('CorridorPatternGenerator', () => {
+  describe('generate()', () => {
+    it('should generate waypoints along a dense centerline', () => {
+      // ~500m north, traced with a vertex every ~1m
+      const centerlineCoords: Coordinate[] = Array.from({ length: 451 }, (_, i) => ({
+        longitude: -74.07,
+        latitude: 4.71 + i * 0.00001,
+      }));
+
+      const generator = new CorridorPatternGenerator({
+        flightParams: createFlightParams(),
+        flightAngleDeg: 0,
+        gimbalPitchDeg: -90,
+      });
+      const waypoints = generator.generate([], { centerlineCoords, numLines: 1 });
+
+      // ~560m of flight line (with the extensions) at 16m photo spacing
+      expect(waypoints.length).toBeGreaterThan(30);
+      expect(waypoints.length).toBeLessThan(40);
+      waypoints.forEach((wp, i) => expect(wp.index).toBe(i));
+    });
+  });
+});
@@ -94,6 +94,14 @@ export class CorridorPatternGenerator extends PatternGenerator {
     return waypoints;
   }
 
+  /**
+   * Find the corridor axis and width from the polygon's extent.
+   *
+   * The vertices are projected onto the UTM axes in a single min/max pass and
+   * the longer side of that box becomes the centerline. This needs no convex
+   * hull or rotated-rectangle search, at the cost of assuming the corridor is
+   * roughly aligned with east or north.
+   */
   private findPolygonCenterlineAndWidth(
     utmCoords: [number, number][]
   ): { centerline: [number, number][]; width: number } {
@@ -101,15 +109,17 @@ export class CorridorPatternGenerator extends PatternGenerator {
       return { centerline: [], width: 0 };
     }
 
-    // Calculate bounding box
+    // Calculate bounding box (plain comparisons, no per-vertex destructuring)
     let minX = Infinity, maxX = -Infinity;
     let minY = Infinity, maxY = -Infinity;
 
-    for (const [x, y] of utmCoords) {
-      minX = Math.min(minX, x);
-      maxX = Math.max(maxX, x);
-      minY = Math.min(minY, y);
-      maxY = Math.max(maxY, y);
+    for (let i = 0; i < utmCoords.length; i++) {
+      const x = utmCoords[i][0];
+      const y = utmCoords[i][1];
+      if (x < minX) minX = x;
+      if (x > maxX) maxX = x;
+      if (y < minY) minY = y;
+      if (y > maxY) maxY = y;
     }
 
     const bboxWidth = maxX - minX;
@@ -145,7 +155,10 @@ export class CorridorPatternGenerator extends PatternGenerator {
 
     // Convert to UTM
     const utmCoords = this.toUtmCoords(centerlineCoords);
-    const centerline: [number, number][] = utmCoords;
+
+    // Dense (e.g. GPS-traced) centerlines carry far more vertices than the
+    // flight lines need; thin them before every offset line copies them
+    const centerline = thinPolyline(utmCoords, this.flightParams.line_spacing_m / 10);
 
     // Extend centerline
     const extension = this.flightParams.line_spacing_m * 2;
@@ -163,30 +176,12 @@ export class CorridorPatternGenerator extends PatternGenerator {
       return line;
     }
 
-    const coords = line.map(c => [...c] as [number, number]);
-
-    // Extend start
-    const dx0 = coords[0][0] - coords[1][0];
-    const dy0 = coords[0][1] - coords[1][1];
-    const length0 = Math.sqrt(dx0 * dx0 + dy0 * dy0);
-    if (length0 > 0) {
-      coords[0] = [
-        coords[0][0] + (dx0 / length0) * distance,
-        coords[0][1] + (dy0 / length0) * distance,
-      ];
-    }
-
-    // Extend end
+    // Only the endpoints are replaced (never mutated), so a shallow copy is enough
+    const coords = line.slice();
     const lastIdx = coords.length - 1;
-    const dx1 = coords[lastIdx][0] - coords[lastIdx - 1][0];
-    const dy1 = coords[lastIdx][1] - coords[lastIdx - 1][1];
-    const length1 = Math.sqrt(dx1 * dx1 + dy1 * dy1);
-    if (length1 > 0) {
-      coords[lastIdx] = [
-        coords[lastIdx][0] + (dx1 / length1) * distance,
-        coords[lastIdx][1] + (dy1 / length1) * distance,
-      ];
-    }
+
+    coords[0] = extendEndpoint(coords[0], coords[1], distance);
+    coords[lastIdx] = extendEndpoint(coords[lastIdx], coords[lastIdx - 1], distance);
 
     return coords;
   }
@@ -226,86 +221,72 @@ export class CorridorPatternGenerator extends PatternGenerator {
     const px = -dy / length;
     const py = dx / length;
 
+    const n = centerline.length;
     for (let i = 0; i < offsets.length; i++) {
       const offset = offsets[i];
-
-      // Create offset line
-      const offsetLine: [number, number][] = centerline.map(([x, y]) => [
-        x + px * offset,
-        y + py * offset,
-      ]);
-
-      // Alternate direction for serpentine pattern
-      if (i % 2 === 1) {
-        lines.push([...offsetLine].reverse());
+      const offsetX = px * offset;
+      const offsetY = py * offset;
+
+      // Create offset line, written back to front on odd lines for the
+      // serpentine pattern instead of copying and reversing it afterwards
+      const reverse = i % 2 === 1;
+      const offsetLine: [number, number][] = new Array(n);
+      if (offset === 0) {
+        // Centre line (single-line corridors and the middle of odd counts):
+        // reuse the centerline vertices, there is nothing to offset
+        for (let j = 0; j < n; j++) {
+          offsetLine[reverse ? n - 1 - j : j] = centerline[j];
+        }
       } else {
-        lines.push(offsetLine);
+        for (let j = 0; j < n; j++) {
+          const [x, y] = centerline[j];
+          offsetLine[reverse ? n - 1 - j : j] = [x + offsetX, y + offsetY];
+        }
       }
+
+      lines.push(offsetLine);
     }
 
     return lines;
   }
+}
 
-  private linesToWaypoints(lines: [number, number][][]): Waypoint[] {
-    const waypoints: Waypoint[] = [];
-    let index = 0;
-    const photoSpacing = this.flightParams.photo_spacing_m;
-
-    for (const line of lines) {
-      if (line.length < 2) continue;
-
-      // Calculate heading for this line
-      const start = line[0];
-      const end = line[line.length - 1];
-      const heading = this.calculateHeading(start, end);
-
-      // Calculate line length
-      let lineLength = 0;
-      for (let i = 1; i < line.length; i++) {
-        const dx = line[i][0] - line[i - 1][0];
-        const dy = line[i][1] - line[i - 1][1];
-        lineLength += Math.sqrt(dx * dx + dy * dy);
-      }
-
-      if (lineLength < photoSpacing / 2) continue;
-
-      const numPhotos = Math.max(2, Math.floor(lineLength / photoSpacing) + 1);
-
-      for (let j = 0; j < numPhotos; j++) {
-        const fraction = numPhotos > 1 ? j / (numPhotos - 1) : 0;
-        const targetDist = fraction * lineLength;
-
-        // Find point at targetDist along the line
-        let accDist = 0;
-        let point: [number, number] = line[0];
-
-        for (let i = 1; i < line.length; i++) {
-          const dx = line[i][0] - line[i - 1][0];
-          const dy = line[i][1] - line[i - 1][1];
-          const segLength = Math.sqrt(dx * dx + dy * dy);
-
-          if (accDist + segLength >= targetDist) {
-            const t = segLength > 0 ? (targetDist - accDist) / segLength : 0;
-            point = [
-              line[i - 1][0] + dx * t,
-              line[i - 1][1] + dy * t,
-            ];
-            break;
-          }
-          accDist += segLength;
-          point = line[i];
-        }
-
-        // Convert to WGS84
-        const [lon, lat] = this.transformer!.toWgs84(point[0], point[1]);
-
-        waypoints.push(
-          this.createWaypoint(index, lon, lat, heading, undefined, true)
-        );
-        index++;
-      }
+/**
+ * Drop vertices closer than `tolerance` to the last kept vertex.
+ * The first and last vertices are always kept.
+ */
+export function thinPolyline(line: [number, number][], tolerance: number): [number, number][] {
+  if (line.length <= 2 || !(tolerance > 0)) return line;
+
+  const toleranceSq = tolerance * tolerance;
+  const result: [number, number][] = [line[0]];
+  let last = line[0];
+  for (let i = 1; i < line.length - 1; i++) {
+    const dx = line[i][0] - last[0];
+    const dy = line[i][1] - last[1];
+    if (dx * dx + dy * dy >= toleranceSq) {
+      result.push(line[i]);
+      last = line[i];
     }
-
-    return waypoints;
   }
+  result.push(line[line.length - 1]);
+  return result;
+}
+
+/**
+ * Move an endpoint `distance` further away from its neighbouring vertex.
+ */
+function extendEndpoint(
+  point: [number, number],
+  neighbor: [number, number],
+  distance: number
+): [number, number] {
+  const dx = point[0] - neighbor[0];
+  const dy = point[1] - neighbor[1];
+  const length = Math.hypot(dx, dy);
+  if (length === 0) return point;
+  return [
+    point[0] + (dx / length) * distance,
+    point[1] + (dy / length) * distance,
+  ];
 }
@@ -22,14 +22,19 @@ const createFlightParams = (overrides?: Partial<FlightParams>): FlightParams =>
   ...overrides,
 });
 
-// Test polygon
-const createTestPolygon = (): Coordinate[] => [
+// Test polygon: a square of sizeDeg degrees per side. The default (~220m)
+// already gives several lines per pass; only tests that need a dense grid
+// should ask for a larger one.
+const createTestPolygon = (sizeDeg: number = 0.002): Coordinate[] => [
   { longitude: -74.0750, latitude: 4.7100 },
-  { longitude: -74.0700, latitude: 4.7100 },
-  { longitude: -74.0700, latitude: 4.7150 },
-  { longitude: -74.0750, latitude: 4.7150 },
+  { longitude: -74.0750 + sizeDeg, latitude: 4.7100 },
+  { longitude: -74.0750 + sizeDeg, latitude: 4.7100 + sizeDeg },
+  { longitude: -74.0750, latitude: 4.7100 + sizeDeg },
 ];
 
+// Flight angles the structural checks run at; add angles here, not new tests
+const FLIGHT_ANGLES = [0, 30, 90];
+
 describe('DoubleGridPatternGenerator', () => {
   describe('generate()', () => {
     it('should generate waypoints', () => {
@@ -69,11 +74,11 @@ describe('DoubleGridPatternGenerator', () => {
       expect(doubleWaypoints.length).toBeGreaterThanOrEqual(singleWaypoints.length * 1.5);
     });
 
-    it('should have sequential indices across both passes', () => {
+    it.each(FLIGHT_ANGLES)('should have sequential indices across both passes at %i°', (flightAngleDeg) => {
       const params = createFlightParams();
       const generator = new DoubleGridPatternGenerator({
         flightParams: params,
-        flightAngleDeg: 0,
+        flightAngleDeg,
         gimbalPitchDeg: -90,
       });
 
@@ -96,11 +101,11 @@ describe('DoubleGridPatternGenerator', () => {
       expect(generator.generate([{ longitude: 0, latitude: 0 }])).toEqual([]);
     });
 
-    it('should have valid coordinates in all waypoints', () => {
+    it.each(FLIGHT_ANGLES)('should have valid coordinates in all waypoints at %i°', (flightAngleDeg) => {
       const params = createFlightParams();
       const generator = new DoubleGridPatternGenerator({
         flightParams: params,
-        flightAngleDeg: 0,
+        flightAngleDeg,
         gimbalPitchDeg: -90,
       });
 
@@ -127,7 +132,7 @@ describe('DoubleGridPatternGenerator', () => {
         gimbalPitchDeg: -90,
       });
 
-      const waypoints = generator.generate(createTestPolygon());
+      const waypoints = generator.generate(createTestPolygon(0.005));
 
       // Should have waypoints from both passes
       expect(waypoints.length).toBeGreaterThan(0);
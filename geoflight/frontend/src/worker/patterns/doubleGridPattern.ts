@@ -31,31 +31,34 @@ export class DoubleGridPatternGenerator extends GridPatternGenerator {
       return [];
     }
 
+    // Transformer and buffered UTM polygon are shared by both passes
+    const { bufferPercent = 15 } = options;
+    const bufferedCoords = this.preparePolygon(polygonCoords, bufferPercent);
+
+    // Both passes read only the prepared polygon and their own angle, so they
+    // are independent; the generator's flight angle is never modified
+    const firstAngle = this.flightAngleDeg;
+    const secondAngle = (firstAngle + 90) % 360;
+
     // First pass at original angle
-    console.log('[DoubleGridPattern] First pass at angle', this.flightAngleDeg);
-    const firstPass = super.generate(polygonCoords, options);
+    console.log('[DoubleGridPattern] First pass at angle', firstAngle);
+    const firstPass = this.generateFromPrepared(bufferedCoords, firstAngle);
     console.log('[DoubleGridPattern] First pass generated', firstPass.length, 'waypoints');
 
     // Second pass at perpendicular angle (+90 degrees)
-    const originalAngle = this.flightAngleDeg;
-    this.flightAngleDeg = (originalAngle + 90) % 360;
-    console.log('[DoubleGridPattern] Second pass at angle', this.flightAngleDeg);
-
-    const secondPass = super.generate(polygonCoords, options);
+    console.log('[DoubleGridPattern] Second pass at angle', secondAngle);
+    const secondPass = this.generateFromPrepared(bufferedCoords, secondAngle);
     console.log('[DoubleGridPattern] Second pass generated', secondPass.length, 'waypoints');
 
-    // Re-index second pass waypoints (immutable - create new objects)
+    // Re-index second pass waypoints. They were just created by this call and
+    // are not shared, so the index is shifted in place instead of copying each one.
     const offset = firstPass.length;
-    const reindexedSecondPass = secondPass.map(wp => ({
-      ...wp,
-      index: wp.index + offset,
-    }));
-
-    // Restore original angle
-    this.flightAngleDeg = originalAngle;
+    for (let i = 0; i < secondPass.length; i++) {
+      secondPass[i].index += offset;
+    }
 
     // Combine passes
-    const total = [...firstPass, ...reindexedSecondPass];
+    const total = firstPass.concat(secondPass);
     console.log('[DoubleGridPattern] Total waypoints:', total.length);
     return total;
   }
@@ -4,7 +4,7 @@
 
 import { describe, it, expect } from 'vitest';
 import { GridPatternGenerator } from './gridPattern';
-import type { FlightParams, Coordinate } from '../../types';
+import type { FlightParams, Coordinate, Waypoint } from '../../types';
 
 // Test flight params
 const createFlightParams = (overrides?: Partial<FlightParams>): FlightParams => ({
@@ -29,18 +29,33 @@ const createTestPolygon = (): Coordinate[] => [
   { longitude: -74.0721, latitude: 4.7120 },
 ];
 
+// Larger ~550m x 550m square, shared by the multi-line tests (read-only)
+const LARGE_TEST_POLYGON: Coordinate[] = [
+  { longitude: -74.0750, latitude: 4.7100 },
+  { longitude: -74.0700, latitude: 4.7100 },
+  { longitude: -74.0700, latitude: 4.7150 },
+  { longitude: -74.0750, latitude: 4.7150 },
+];
+
+// Default-parameter grid over the test polygon, generated once and shared by
+// the tests that only inspect it (none of them modify the waypoints)
+let defaultGridWaypoints: Waypoint[] | null = null;
+const getDefaultGridWaypoints = (): Waypoint[] => {
+  if (!defaultGridWaypoints) {
+    const generator = new GridPatternGenerator({
+      flightParams: createFlightParams(),
+      flightAngleDeg: 0,
+      gimbalPitchDeg: -90,
+    });
+    defaultGridWaypoints = generator.generate(createTestPolygon());
+  }
+  return defaultGridWaypoints;
+};
+
 describe('GridPatternGenerator', () => {
   describe('generate()', () => {
     it('should generate waypoints for a simple polygon', () => {
-      const params = createFlightParams();
-      const generator = new GridPatternGenerator({
-        flightParams: params,
-        flightAngleDeg: 0,
-        gimbalPitchDeg: -90,
-      });
-
-      const polygon = createTestPolygon();
-      const waypoints = generator.generate(polygon);
+      const waypoints = getDefaultGridWaypoints();
 
       expect(waypoints.length).toBeGreaterThan(0);
       expect(waypoints[0]).toHaveProperty('longitude');
@@ -58,7 +73,7 @@ describe('GridPatternGenerator', () => {
 
       const waypoints = generator.generate(createTestPolygon());
 
-      expect(waypoints.every(wp => wp.altitude === 80)).toBe(true);
+      expect(new Set(waypoints.map(wp => wp.altitude))).toEqual(new Set([80]));
     });
 
     it('should set correct gimbal pitch on all waypoints', () => {
@@ -71,7 +86,7 @@ describe('GridPatternGenerator', () => {
 
       const waypoints = generator.generate(createTestPolygon());
 
-      expect(waypoints.every(wp => wp.gimbal_pitch === -45)).toBe(true);
+      expect(new Set(waypoints.map(wp => wp.gimbal_pitch))).toEqual(new Set([-45]));
     });
 
     it('should return empty array for empty polygon', () => {
@@ -139,14 +154,7 @@ describe('GridPatternGenerator', () => {
     });
 
     it('should have valid coordinates in all waypoints', () => {
-      const params = createFlightParams();
-      const generator = new GridPatternGenerator({
-        flightParams: params,
-        flightAngleDeg: 0,
-        gimbalPitchDeg: -90,
-      });
-
-      const waypoints = generator.generate(createTestPolygon());
+      const waypoints = getDefaultGridWaypoints();
 
       for (const wp of waypoints) {
         expect(wp.longitude).not.toBeNaN();
@@ -159,14 +167,7 @@ describe('GridPatternGenerator', () => {
     });
 
     it('should have sequential indices', () => {
-      const params = createFlightParams();
-      const generator = new GridPatternGenerator({
-        flightParams: params,
-        flightAngleDeg: 0,
-        gimbalPitchDeg: -90,
-      });
-
-      const waypoints = generator.generate(createTestPolygon());
+      const waypoints = getDefaultGridWaypoints();
 
       for (let i = 0; i < waypoints.length; i++) {
         expect(waypoints[i].index).toBe(i);
@@ -225,14 +226,7 @@ describe('GridPatternGenerator', () => {
       });
 
       // Larger polygon to ensure multiple lines
-      const polygon: Coordinate[] = [
-        { longitude: -74.0750, latitude: 4.7100 },
-        { longitude: -74.0700, latitude: 4.7100 },
-        { longitude: -74.0700, latitude: 4.7150 },
-        { longitude: -74.0750, latitude: 4.7150 },
-      ];
-
-      const waypoints = generator.generate(polygon);
+      const waypoints = generator.generate(LARGE_TEST_POLYGON);
 
       // Should have enough waypoints for multiple lines
       expect(waypoints.length).toBeGreaterThan(10);
@@ -257,13 +251,6 @@ describe('GridPatternGenerator', () => {
 
   describe('line spacing', () => {
     it('should respect line spacing parameter', () => {
-      const polygon: Coordinate[] = [
-        { longitude: -74.0750, latitude: 4.7100 },
-        { longitude: -74.0700, latitude: 4.7100 },
-        { longitude: -74.0700, latitude: 4.7150 },
-        { longitude: -74.0750, latitude: 4.7150 },
-      ];
-
       // Test with different line spacings
       const params20 = createFlightParams({ line_spacing_m: 20, photo_spacing_m: 10 });
       const params50 = createFlightParams({ line_spacing_m: 50, photo_spacing_m: 10 });
@@ -280,8 +267,8 @@ describe('GridPatternGenerator', () => {
         gimbalPitchDeg: -90,
       });
 
-      const waypoints20 = generator20.generate(polygon);
-      const waypoints50 = generator50.generate(polygon);
+      const waypoints20 = generator20.generate(LARGE_TEST_POLYGON);
+      const waypoints50 = generator50.generate(LARGE_TEST_POLYGON);
 
       // Smaller line spacing should result in more waypoints
       expect(waypoints20.length).toBeGreaterThan(waypoints50.length);
@@ -10,6 +10,132 @@ export interface GridOptions {
   bufferPercent?: number;
 }
 
+/**
+ * Polygon edges as struct-of-arrays: start vertex and (start - end) vector of
+ * each edge. Built once per polygon and shared by every clipped line.
+ */
+interface PolygonEdges {
+  x: Float64Array;
+  y: Float64Array;
+  ex: Float64Array;
+  ey: Float64Array;
+}
+
+/**
+ * Flatten a closed polygon ring into PolygonEdges.
+ */
+function toPolygonEdges(polygon: [number, number][]): PolygonEdges {
+  const count = Math.max(0, polygon.length - 1);
+  const edges: PolygonEdges = {
+    x: new Float64Array(count),
+    y: new Float64Array(count),
+    ex: new Float64Array(count),
+    ey: new Float64Array(count),
+  };
+  for (let i = 0; i < count; i++) {
+    edges.x[i] = polygon[i][0];
+    edges.y[i] = polygon[i][1];
+    edges.ex[i] = polygon[i][0] - polygon[i + 1][0];
+    edges.ey[i] = polygon[i][1] - polygon[i + 1][1];
+  }
+  return edges;
+}
+
+/**
+ * Clip a line segment to a polygon using ray-polygon intersection.
+ *
+ * Returns the first and last crossing along the line (entry and exit). Only
+ * the two extreme crossings are tracked, so no intersection list is built or
+ * sorted; ties keep the same points a stable sort by projection would.
+ */
+function clipLineToPolygon(
+  start: [number, number],
+  end: [number, number],
+  edges: PolygonEdges
+): [number, number][] | null {
+  const x1 = start[0], y1 = start[1];
+  const dx = end[0] - x1;
+  const dy = end[1] - y1;
+
+  if (dx === 0 && dy === 0) return null;
+
+  const { x: edgeX, y: edgeY, ex, ey } = edges;
+  let count = 0;
+  let minKey = Infinity, minX = 0, minY = 0;
+  let maxKey = -Infinity, maxX = 0, maxY = 0;
+
+  // Use all polygon edges for intersection (polygon should be closed)
+  for (let i = 0; i < ex.length; i++) {
+    const x3 = edgeX[i], y3 = edgeY[i];
+    const x34 = ex[i], y34 = ey[i];
+
+    // Segment-segment intersection (same formulation as before, with p2 = end)
+    const denom = -dx * y34 + dy * x34;
+    if (Math.abs(denom) < 1e-10) continue; // Parallel lines
+
+    const t = ((x1 - x3) * y34 - (y1 - y3) * x34) / denom;
+    const u = -(-dx * (y1 - y3) + dy * (x1 - x3)) / denom;
+
+    // Check if intersection is within both segments
+    if (t < 0 || t > 1 || u < 0 || u > 1) continue;
+
+    const ix = x1 + t * dx;
+    const iy = y1 + t * dy;
+    const key = (ix - x1) * dx + (iy - y1) * dy;
+    count++;
+
+    if (key < minKey) {
+      minKey = key;
+      minX = ix;
+      minY = iy;
+    }
+    if (key >= maxKey) {
+      maxKey = key;
+      maxX = ix;
+      maxY = iy;
+    }
+  }
+
+  if (count < 2) return null;
+
+  return [[minX, minY], [maxX, maxY]];
+}
+
+/**
+ * Unit vectors of the rotated grid frame for a flight angle.
+ */
+interface FlightAxes {
+  flightDirX: number;
+  flightDirY: number;
+  cosPerp: number;
+  sinPerp: number;
+}
+
+/**
+ * Build the grid frame (flight direction and its perpendicular) for an angle
+ * measured clockwise from north. Trig is evaluated once here; line building
+ * and line ordering only read the resulting vectors.
+ */
+function flightAxes(angleDeg: number): FlightAxes {
+  const angleRad = angleDeg * (Math.PI / 180);
+  const sinAngle = Math.sin(angleRad);
+  const cosAngle = Math.cos(angleRad);
+
+  return {
+    // Flight direction: for angle measured from north clockwise
+    // Direction vector is (sin(angle), cos(angle)) in (X=East, Y=North) coordinates
+    // - angle=0 -> (0, 1) = north
+    // - angle=90 -> (1, 0) = east
+    flightDirX: sinAngle,
+    flightDirY: cosAngle,
+    // Perpendicular direction (90° clockwise from flight direction)
+    // Rotate (x, y) by 90° clockwise -> (y, -x)
+    // So perpendicular to (sin(θ), cos(θ)) is (cos(θ), -sin(θ))
+    cosPerp: cosAngle,
+    sinPerp: -sinAngle,
+  };
+}
+
 export class GridPatternGenerator extends PatternGenerator {
   constructor(config: PatternGeneratorConfig) {
     super(config);
@@ -33,6 +159,15 @@ export class GridPatternGenerator extends PatternGenerator {
       return [];
     }
 
+    const bufferedCoords = this.preparePolygon(polygonCoords, bufferPercent);
+    return this.generateFromPrepared(bufferedCoords, this.flightAngleDeg);
+  }
+
+  /**
+   * Set up the UTM transformer and build the buffered, closed UTM polygon.
+   * Kept separate from line generation so several passes can share it.
+   */
+  protected preparePolygon(polygonCoords: Coordinate[], bufferPercent: number): [number, number][] {
     // Setup coordinate transformation
     this.setupTransformers(polygonCoords);
 
@@ -60,9 +195,17 @@ export class GridPatternGenerator extends PatternGenerator {
     console.log('[GridPattern] Original area:', origArea, 'Buffered area:', buffArea,
                 'Expanded:', buffArea > origArea ? 'YES (correct)' : 'NO (wrong!)');
 
+    return bufferedCoords;
+  }
+
+  /**
+   * Generate waypoints at a flight angle over a polygon from preparePolygon.
+   * Does not touch generator state, so passes at different angles are independent.
+   */
+  protected generateFromPrepared(bufferedCoords: [number, number][], angleDeg: number): Waypoint[] {
     // Generate grid lines on buffered polygon
     console.log('[GridPattern] Buffered coords:', bufferedCoords.slice(0, 3), '...');
-    const lines = this.generateGridLines(bufferedCoords);
+    const lines = this.generateGridLines(bufferedCoords, angleDeg);
 
     console.log('[GridPattern] Generated', lines.length, 'lines');
     if (lines.length > 0) {
@@ -99,6 +242,17 @@ export class GridPatternGenerator extends PatternGenerator {
     const result: [number, number][] = [];
     const n = coords.length - 1; // Exclude closing point
 
+    // For polygon buffer, we want to expand outward
+    // The left perpendicular (-dy, dx) points:
+    // - INWARD for CCW polygons (interior is on the left of edges)
+    // - OUTWARD for CW polygons (interior is on the right of edges)
+    // So we need to NEGATE for CCW to go outward
+    // The orientation is a property of the whole ring, so it is computed once.
+    const area = this.polygonArea(coords);
+    // For CCW (area > 0): negate to go outward (sign = -1)
+    // For CW (area < 0): keep positive to go outward (sign = 1)
+    const sign = area > 0 ? -1 : 1;
+
     for (let i = 0; i < n; i++) {
       const prev = coords[(i - 1 + n) % n];
       const curr = coords[i];
@@ -135,16 +289,6 @@ export class GridPatternGenerator extends PatternGenerator {
         ny /= nLen;
       }
 
-      // For polygon buffer, we want to expand outward
-      // The left perpendicular (-dy, dx) points:
-      // - INWARD for CCW polygons (interior is on the left of edges)
-      // - OUTWARD for CW polygons (interior is on the right of edges)
-      // So we need to NEGATE for CCW to go outward
-      const area = this.polygonArea(coords);
-      // For CCW (area > 0): negate to go outward (sign = -1)
-      // For CW (area < 0): keep positive to go outward (sign = 1)
-      const sign = area > 0 ? -1 : 1;
-
       result.push([
         curr[0] + sign * nx * distance,
         curr[1] + sign * ny * distance,
@@ -173,18 +317,20 @@ export class GridPatternGenerator extends PatternGenerator {
     return area / 2;
   }
 
-  protected generateGridLines(polygonCoords: [number, number][]): [number, number][][] {
+  protected generateGridLines(polygonCoords: [number, number][], angle: number): [number, number][][] {
     if (polygonCoords.length < 3) return [];
 
     // Calculate polygon bounding box
     let minX = Infinity, maxX = -Infinity;
     let minY = Infinity, maxY = -Infinity;
 
-    for (const [x, y] of polygonCoords) {
-      minX = Math.min(minX, x);
-      maxX = Math.max(maxX, x);
-      minY = Math.min(minY, y);
-      maxY = Math.max(maxY, y);
+    for (let i = 0; i < polygonCoords.length; i++) {
+      const x = polygonCoords[i][0];
+      const y = polygonCoords[i][1];
+      if (x < minX) minX = x;
+      if (x > maxX) maxX = x;
+      if (y < minY) minY = y;
+      if (y > maxY) maxY = y;
     }
 
     const centerX = (minX + maxX) / 2;
@@ -194,52 +340,57 @@ export class GridPatternGenerator extends PatternGenerator {
     console.log('[GridPattern] BBox:', { minX, maxX, minY, maxY });
     console.log('[GridPattern] Center:', { centerX, centerY }, 'Diagonal:', diagonal);
 
-    const angle = this.flightAngleDeg;
     const lineSpacing = this.flightParams.line_spacing_m;
     console.log('[GridPattern] Angle:', angle, 'Line spacing:', lineSpacing);
-    const angleRad = angle * (Math.PI / 180);
+    const { flightDirX, flightDirY, cosPerp, sinPerp } = flightAxes(angle);
 
-    // Flight direction: for angle measured from north clockwise
-    // Direction vector is (sin(angle), cos(angle)) in (X=East, Y=North) coordinates
-    // - angle=0 -> (0, 1) = north
-    // - angle=90 -> (1, 0) = east
-    const flightDirX = Math.sin(angleRad);
-    const flightDirY = Math.cos(angleRad);
-
-    // Perpendicular direction (90° clockwise from flight direction)
-    // Rotate (x, y) by 90° clockwise -> (y, -x)
-    // So perpendicular to (sin(θ), cos(θ)) is (cos(θ), -sin(θ))
-    const cosPerp = Math.cos(angleRad);
-    const sinPerp = -Math.sin(angleRad);
+    // Line extent along the flight direction, shared by every line
+    const alongX = diagonal * flightDirX;
+    const alongY = diagonal * flightDirY;
 
     console.log('[GridPattern] Flight dir:', { x: flightDirX, y: flightDirY });
     console.log('[GridPattern] Perp dir:', { x: cosPerp, y: sinPerp });
 
-    // Generate parallel lines
+    // Generate parallel lines, keeping each line's midpoint projection on the
+    // perpendicular axis as the sort key
     const lines: [number, number][][] = [];
+    const projections: number[] = [];
+    let alreadySorted = true;
     const numLines = Math.ceil((diagonal * 2) / lineSpacing) + 1;
     const startOffset = -numLines / 2 * lineSpacing;
 
+    // Edge data is flattened once and reused by every line
+    const edges = toPolygonEdges(polygonCoords);
+
     let clippedCount = 0;
     for (let i = 0; i <= numLines; i++) {
       const offset = startOffset + i * lineSpacing;
 
       // Line endpoints extending from center
       // Offset perpendicular to flight direction, extend along flight direction
-      const lineStartX = centerX + offset * cosPerp - diagonal * flightDirX;
-      const lineStartY = centerY + offset * sinPerp - diagonal * flightDirY;
-      const lineEndX = centerX + offset * cosPerp + diagonal * flightDirX;
-      const lineEndY = centerY + offset * sinPerp + diagonal * flightDirY;
+      const lineCenterX = centerX + offset * cosPerp;
+      const lineCenterY = centerY + offset * sinPerp;
+      const lineStartX = lineCenterX - alongX;
+      const lineStartY = lineCenterY - alongY;
+      const lineEndX = lineCenterX + alongX;
+      const lineEndY = lineCenterY + alongY;
 
       // Clip line to polygon
-      const clipped = this.clipLineToPolygon(
+      const clipped = clipLineToPolygon(
         [lineStartX, lineStartY],
         [lineEndX, lineEndY],
-        polygonCoords
+        edges
       );
 
       if (clipped) {
+        const midX = (clipped[0][0] + clipped[1][0]) / 2;
+        const midY = (clipped[0][1] + clipped[1][1]) / 2;
+        const projection = midX * cosPerp + midY * sinPerp;
+        if (projections.length > 0 && projection < projections[projections.length - 1]) {
+          alreadySorted = false;
+        }
         lines.push(clipped);
+        projections.push(projection);
         clippedCount++;
       }
     }
@@ -247,139 +398,21 @@ export class GridPatternGenerator extends PatternGenerator {
 
     if (lines.length === 0) return [];
 
-    // Sort lines by perpendicular distance
-    lines.sort((a, b) => {
-      const midA = [(a[0][0] + a[1][0]) / 2, (a[0][1] + a[1][1]) / 2];
-      const midB = [(b[0][0] + b[1][0]) / 2, (b[0][1] + b[1][1]) / 2];
-      const projA = midA[0] * cosPerp + midA[1] * sinPerp;
-      const projB = midB[0] * cosPerp + midB[1] * sinPerp;
-      return projA - projB;
-    });
+    // Sort lines by perpendicular distance. Offsets are generated in increasing
+    // order, so the sort is normally skipped.
+    const order: number[] = new Array(lines.length);
+    for (let i = 0; i < lines.length; i++) order[i] = i;
+    if (!alreadySorted) {
+      order.sort((a, b) => projections[a] - projections[b]);
+    }
 
     // Create serpentine pattern
-    const serpentineLines: [number, number][][] = [];
-    for (let i = 0; i < lines.length; i++) {
-      if (i % 2 === 1) {
-        serpentineLines.push([lines[i][1], lines[i][0]]); // Reverse
-      } else {
-        serpentineLines.push(lines[i]);
-      }
+    const serpentineLines: [number, number][][] = new Array(lines.length);
+    for (let i = 0; i < order.length; i++) {
+      const line = lines[order[i]];
+      serpentineLines[i] = i % 2 === 1 ? [line[1], line[0]] : line; // Reverse odd lines
     }
 
     return serpentineLines;
   }
-
-  /**
-   * Clip a line segment to a polygon using ray-polygon intersection
-   */
-  private clipLineToPolygon(
-    start: [number, number],
-    end: [number, number],
-    polygon: [number, number][]
-  ): [number, number][] | null {
-    const intersections: [number, number][] = [];
-
-    const dx = end[0] - start[0];
-    const dy = end[1] - start[1];
-    const lineLen = Math.sqrt(dx * dx + dy * dy);
-
-    if (lineLen === 0) return null;
-
-    // Use all polygon vertices for intersection (polygon should be closed)
-    const n = polygon.length;
-
-    for (let i = 0; i < n - 1; i++) {
-      const p1 = polygon[i];
-      const p2 = polygon[i + 1];
-
-      const intersection = this.lineSegmentIntersection(
-        start, end, p1, p2
-      );
-
-      if (intersection) {
-        intersections.push(intersection);
-      }
-    }
-
-    if (intersections.length < 2) return null;
-
-    // Sort intersections along the line
-    intersections.sort((a, b) => {
-      const tA = (a[0] - start[0]) * dx + (a[1] - start[1]) * dy;
-      const tB = (b[0] - start[0]) * dx + (b[1] - start[1]) * dy;
-      return tA - tB;
-    });
-
-    // Return first and last intersection (entry and exit)
-    return [intersections[0], intersections[intersections.length - 1]];
-  }
-
-  /**
-   * Calculate intersection point of two line segments
-   */
-  private lineSegmentIntersection(
-    p1: [number, number],
-    p2: [number, number],
-    p3: [number, number],
-    p4: [number, number]
-  ): [number, number] | null {
-    const x1 = p1[0], y1 = p1[1];
-    const x2 = p2[0], y2 = p2[1];
-    const x3 = p3[0], y3 = p3[1];
-    const x4 = p4[0], y4 = p4[1];
-
-    const denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4);
-
-    if (Math.abs(denom) < 1e-10) return null; // Parallel lines
-
-    const t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom;
-    const u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denom;
-
-    // Check if intersection is within both segments
-    if (t >= 0 && t <= 1 && u >= 0 && u <= 1) {
-      return [
-        x1 + t * (x2 - x1),
-        y1 + t * (y2 - y1),
-      ];
-    }
-
-    return null;
-  }
-
-  protected linesToWaypoints(lines: [number, number][][]): Waypoint[] {
-    const waypoints: Waypoint[] = [];
-    let index = 0;
-    const photoSpacing = this.flightParams.photo_spacing_m;
-
-    for (const line of lines) {
-      if (line.length < 2) continue;
-
-      const [startPt, endPt] = line;
-      const heading = this.calculateHeading(startPt, endPt);
-
-      const dx = endPt[0] - startPt[0];
-      const dy = endPt[1] - startPt[1];
-      const lineLength = Math.sqrt(dx * dx + dy * dy);
-
-      if (lineLength < photoSpacing / 2) continue;
-
-      const numPhotos = Math.max(2, Math.floor(lineLength / photoSpacing) + 1);
-
-      for (let j = 0; j < numPhotos; j++) {
-        const fraction = numPhotos > 1 ? j / (numPhotos - 1) : 0;
-
-        const x = startPt[0] + dx * fraction;
-        const y = startPt[1] + dy * fraction;
-
-        const [lon, lat] = this.transformer!.toWgs84(x, y);
-
-        waypoints.push(
-          this.createWaypoint(index, lon, lat, heading, undefined, true)
-        );
-        index++;
-      }
-    }
-
-    return waypoints;
-  }
 }
@@ -0,0 +1,132 @@
+/**
+ * Tests for OrbitPatternGenerator
+ */
+
+import { describe, it, expect } from 'vitest';
+import { OrbitPatternGenerator } from './orbitPattern';
+import type { FlightParams, Coordinate } from '../../types';
+
+// Test flight params
+const createFlightParams = (overrides?: Partial<FlightParams>): FlightParams => ({
+  altitude_m: 60,
+  gsd_cm_px: 2.0,
+  footprint_width_m: 85.6,
+  footprint_height_m: 64.2,
+  line_spacing_m: 30,
+  photo_spacing_m: 16,
+  max_speed_ms: 8.0,
+  photo_interval_s: 2.0,
+  estimated_photos: 0,
+  estimated_flight_time_min: 0,
+  ...overrides,
+});
+
+// Test polygon
+const createTestPolygon = (): Coordinate[] => [
+  { longitude: -74.0750, latitude: 4.7100 },
+  { longitude: -74.0700, latitude: 4.7100 },
+  { longitude: -74.0700, latitude: 4.7150 },
+  { longitude: -74.0750, latitude: 4.7150 },
+];
+
+describe('OrbitPatternGenerator', () => {
+  describe('generate()', () => {
+    it('should generate photosPerOrbit waypoints per orbit', () => {
+      const generator = new OrbitPatternGenerator({
+        flightParams: createFlightParams(),
+        flightAngleDeg: 0,
+        gimbalPitchDeg: -60,
+      });
+
+      const waypoints = generator.generate(createTestPolygon(), { numOrbits: 3, photosPerOrbit: 12 });
+
+      expect(waypoints).toHaveLength(36);
+      waypoints.forEach((wp, i) => expect(wp.index).toBe(i));
+    });
+
+    it('should repeat the same ring positions and headings on every orbit', () => {
+      const generator = new OrbitPatternGenerator({
+        flightParams: createFlightParams(),
+        flightAngleDeg: 0,
+        gimbalPitchDeg: -60,
+      });
+
+      const waypoints = generator.generate(createTestPolygon(), { numOrbits: 2, photosPerOrbit: 8 });
+
+      for (let i = 0; i < 8; i++) {
+        expect(waypoints[i + 8].longitude).toBe(waypoints[i].longitude);
+        expect(waypoints[i + 8].latitude).toBe(waypoints[i].latitude);
+        expect(waypoints[i + 8].heading).toBe(waypoints[i].heading);
+      }
+    });
+
+    it('should step altitude and level the gimbal on higher orbits', () => {
+      const generator = new OrbitPatternGenerator({
+        flightParams: createFlightParams({ altitude_m: 50 }),
+        flightAngleDeg: 0,
+        gimbalPitchDeg: -60,
+      });
+
+      const waypoints = generator.generate(createTestPolygon(), {
+        numOrbits: 2,
+        photosPerOrbit: 4,
+        altitudeStepM: 15,
+      });
+
+      expect(waypoints[0].altitude).toBe(50);
+      expect(waypoints[0].gimbal_pitch).toBe(-60);
+      expect(waypoints[4].altitude).toBe(65);
+      expect(waypoints[4].gimbal_pitch).toBe(-50);
+    });
+
+    it('should point headings toward the center', () => {
+      const generator = new OrbitPatternGenerator({
+        flightParams: createFlightParams(),
+        flightAngleDeg: 0,
+        gimbalPitchDeg: -60,
+      });
+
+      const waypoints = generator.generate([], {
+        center: { longitude: -74.0721, latitude: 4.7110 },
+        radiusM: 30,
+        photosPerOrbit: 4,
+      });
+
+      expect(waypoints.map(wp => wp.heading)).toEqual([180, 270, 0, 90]);
+      // North of the center first, then east
+      expect(waypoints[0].latitude).toBeGreaterThan(4.7110);
+      expect(waypoints[1].longitude).toBeGreaterThan(-74.0721);
+    });
+
+    it('should center the orbit on the area centroid of the polygon', () => {
+      const generator = new OrbitPatternGenerator({
+        flightParams: createFlightParams(),
+        flightAngleDeg: 0,
+        gimbalPitchDeg: -60,
+      });
+
+      // Square with an extra vertex crowding one corner: the vertex average is
+      // pulled toward that corner, the area centroid is not
+      const polygon = createTestPolygon();
+      polygon.splice(1, 0, { longitude: -74.0701, latitude: 4.7100 });
+      const waypoints = generator.generate(polygon, { photosPerOrbit: 4 });
+
+      // Ring points at 0 and 180 degrees straddle the center north/south,
+      // those at 90 and 270 degrees east/west
+      const centerLon = (waypoints[1].longitude + waypoints[3].longitude) / 2;
+      const centerLat = (waypoints[0].latitude + waypoints[2].latitude) / 2;
+      expect(centerLon).toBeCloseTo(-74.0725, 5);
+      expect(centerLat).toBeCloseTo(4.7125, 5);
+    });
+
+    it('should return empty array without polygon or center', () => {
+      const generator = new OrbitPatternGenerator({
+        flightParams: createFlightParams(),
+        flightAngleDeg: 0,
+        gimbalPitchDeg: -60,
+      });
+
+      expect(generator.generate([])).toEqual([]);
+    });
+  });
+});
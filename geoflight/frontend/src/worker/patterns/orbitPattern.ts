@@ -6,6 +6,43 @@
 import type { Waypoint, Coordinate } from '../../types';
 import { PatternGenerator, type PatternGeneratorConfig } from './basePattern';
 
+const DEG_TO_RAD = Math.PI / 180;
+
+/**
+ * Area-weighted centroid of a UTM polygon ring (shoelace formula).
+ * Falls back to the vertex average for degenerate (near zero-area) rings.
+ */
+function polygonCentroid(utmCoords: [number, number][]): [number, number] {
+  const n = utmCoords.length;
+
+  // Work relative to the first vertex to keep the cross products small
+  const x0 = utmCoords[0][0];
+  const y0 = utmCoords[0][1];
+  let area2 = 0;
+  let cx = 0;
+  let cy = 0;
+  let sumX = 0;
+  let sumY = 0;
+  for (let i = 0; i < n; i++) {
+    const j = i + 1 < n ? i + 1 : 0;
+    const xi = utmCoords[i][0] - x0;
+    const yi = utmCoords[i][1] - y0;
+    const xj = utmCoords[j][0] - x0;
+    const yj = utmCoords[j][1] - y0;
+    const cross = xi * yj - xj * yi;
+    area2 += cross;
+    cx += (xi + xj) * cross;
+    cy += (yi + yj) * cross;
+    sumX += xi;
+    sumY += yi;
+  }
+
+  if (Math.abs(area2) < 1e-6) {
+    return [x0 + sumX / n, y0 + sumY / n];
+  }
+  return [x0 + cx / (3 * area2), y0 + cy / (3 * area2)];
+}
+
 export interface OrbitOptions {
   center?: Coordinate;
   radiusM?: number;
@@ -87,19 +124,19 @@ export class OrbitPatternGenerator extends PatternGenerator {
     const utmCoords = this.toUtmCoords(polygonCoords);
 
     // Calculate centroid
-    const centerX = utmCoords.reduce((sum, c) => sum + c[0], 0) / utmCoords.length;
-    const centerY = utmCoords.reduce((sum, c) => sum + c[1], 0) / utmCoords.length;
-    const centerUtm: [number, number] = [centerX, centerY];
+    const centerUtm = polygonCentroid(utmCoords);
 
     // Calculate radius as distance to farthest vertex + margin
-    let maxDist = 0;
-    for (const coord of utmCoords) {
-      const dist = Math.sqrt(
-        (coord[0] - centerUtm[0]) ** 2 +
-        (coord[1] - centerUtm[1]) ** 2
-      );
-      maxDist = Math.max(maxDist, dist);
+    // (compare squared distances, take a single sqrt at the end)
+    const n = utmCoords.length;
+    let maxDistSq = 0;
+    for (let i = 0; i < n; i++) {
+      const dx = utmCoords[i][0] - centerUtm[0];
+      const dy = utmCoords[i][1] - centerUtm[1];
+      const distSq = dx * dx + dy * dy;
+      if (distSq > maxDistSq) maxDistSq = distSq;
     }
+    const maxDist = Math.sqrt(maxDistSq);
 
     // Add 20% margin for safety
     const radius = maxDist * 1.2;
@@ -139,6 +176,14 @@ export class OrbitPatternGenerator extends PatternGenerator {
     );
   }
 
+  /**
+   * Generate the waypoints of all orbits around centerUtm.
+   *
+   * Orbits only differ in altitude and gimbal pitch, so the ring is projected
+   * once and each orbit just stamps out waypoint records from it: there is no
+   * per-altitude projection work left to spread over extra workers (this
+   * already runs inside the mission worker).
+   */
   private generateOrbit(
     centerUtm: [number, number],
     radius: number,
@@ -147,9 +192,34 @@ export class OrbitPatternGenerator extends PatternGenerator {
     photosPerOrbit: number,
     startGimbalPitch: number
   ): Waypoint[] {
-    const waypoints: Waypoint[] = [];
-    let index = 0;
     const baseAltitude = this.flightParams.altitude_m;
+    const speed = this.flightParams.max_speed_ms;
+
+    // Every orbit flies the same ring (only altitude and gimbal change), so the
+    // ring positions and headings are computed and projected once up front:
+    // one sin/cos pair per ring angle, regardless of the number of orbits.
+    const angleStep = 360.0 / photosPerOrbit;
+    const ringXs = new Float64Array(photosPerOrbit);
+    const ringYs = new Float64Array(photosPerOrbit);
+    const ringHeadings = new Float64Array(photosPerOrbit);
+
+    for (let i = 0; i < photosPerOrbit; i++) {
+      const angleDeg = i * angleStep;
+      const angleRad = angleDeg * DEG_TO_RAD;
+
+      // Calculate position on orbit
+      ringXs[i] = centerUtm[0] + radius * Math.sin(angleRad);
+      ringYs[i] = centerUtm[1] + radius * Math.cos(angleRad);
+
+      // Heading points toward center
+      ringHeadings[i] = (angleDeg + 180) % 360;
+    }
+
+    // Convert back to WGS84
+    const { lons, lats } = this.transformer!.toWgs84Batch(ringXs, ringYs);
+
+    const waypoints: Waypoint[] = new Array(numOrbits * photosPerOrbit);
+    let index = 0;
 
     for (let orbitNum = 0; orbitNum < numOrbits; orbitNum++) {
       // Altitude for this orbit
@@ -160,34 +230,17 @@ export class OrbitPatternGenerator extends PatternGenerator {
       let gimbalPitch = startGimbalPitch + (orbitNum * 10);
       gimbalPitch = Math.max(-90, Math.min(-15, gimbalPitch));
 
-      // Generate points around the orbit
-      const angleStep = 360.0 / photosPerOrbit;
-
       for (let i = 0; i < photosPerOrbit; i++) {
-        const angleDeg = i * angleStep;
-        const angleRad = angleDeg * (Math.PI / 180);
-
-        // Calculate position on orbit
-        const x = centerUtm[0] + radius * Math.sin(angleRad);
-        const y = centerUtm[1] + radius * Math.cos(angleRad);
-
-        // Convert back to WGS84
-        const [lon, lat] = this.transformer!.toWgs84(x, y);
-
-        // Heading points toward center
-        const heading = (angleDeg + 180) % 360;
-
-        const waypoint: Waypoint = {
+        waypoints[index] = {
           index,
-          longitude: lon,
-          latitude: lat,
+          longitude: lons[i],
+          latitude: lats[i],
           altitude,
-          heading,
+          heading: ringHeadings[i],
           gimbal_pitch: gimbalPitch,
-          speed: this.flightParams.max_speed_ms,
+          speed,
           take_photo: true,
         };
-        waypoints.push(waypoint);
         index++;
       }
     }
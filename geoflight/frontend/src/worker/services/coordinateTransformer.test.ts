@@ -8,6 +8,7 @@ import {
   createTransformer,
   calculateCenter,
   calculateHeading,
+  calculateLineHeadings,
 } from './coordinateTransformer';
 
 describe('getUtmZone', () => {
@@ -52,6 +53,15 @@ describe('createTransformer', () => {
     expect(transformer.utmZone).toBe(18);
   });
 
+  it('should reuse the transformer for the same UTM zone and hemisphere', () => {
+    const a = createTransformer(-74.0721, 4.7110);
+    const b = createTransformer(-74.5, 4.9); // Same zone 18N
+    const c = createTransformer(-74.0721, -4.7110); // Zone 18S
+
+    expect(b).toBe(a);
+    expect(c).not.toBe(a);
+  });
+
   describe('toUtm', () => {
     it('should convert WGS84 to UTM correctly', () => {
       // Bogota, Colombia
@@ -113,6 +123,52 @@ describe('createTransformer', () => {
     });
   });
 
+  describe('toUtmBatch', () => {
+    it('should match per-point toUtm results', () => {
+      const transformer = createTransformer(-74.0721, 4.7110);
+      const coords = [
+        { longitude: -74.0750, latitude: 4.7100 },
+        { longitude: -74.0700, latitude: 4.7150 },
+      ];
+
+      const result = transformer.toUtmBatch(coords);
+
+      expect(result).toHaveLength(2);
+      expect(result[0]).toEqual(transformer.toUtm(-74.0750, 4.7100));
+      expect(result[1]).toEqual(transformer.toUtm(-74.0700, 4.7150));
+    });
+
+    it('should throw for invalid coordinates', () => {
+      const transformer = createTransformer(-74.0721, 4.7110);
+
+      expect(() => transformer.toUtmBatch([{ longitude: NaN, latitude: 4.7110 }])).toThrow();
+    });
+  });
+
+  describe('toWgs84Batch', () => {
+    it('should match per-point toWgs84 results', () => {
+      const transformer = createTransformer(-74.0721, 4.7110);
+      const [x, y] = transformer.toUtm(-74.0721, 4.7110);
+      const xs = new Float64Array([x, x + 100, x + 200]);
+      const ys = new Float64Array([y, y + 50, y - 50]);
+
+      const { lons, lats } = transformer.toWgs84Batch(xs, ys);
+
+      expect(lons.length).toBe(3);
+      for (let i = 0; i < xs.length; i++) {
+        const [lon, lat] = transformer.toWgs84(xs[i], ys[i]);
+        expect(lons[i]).toBe(lon);
+        expect(lats[i]).toBe(lat);
+      }
+    });
+
+    it('should throw for invalid UTM coordinates', () => {
+      const transformer = createTransformer(-74.0721, 4.7110);
+
+      expect(() => transformer.toWgs84Batch([500000, NaN], [500000, 500000])).toThrow();
+    });
+  });
+
   describe('northern vs southern hemisphere', () => {
     it('should handle northern hemisphere correctly', () => {
       const transformer = createTransformer(-74.0721, 4.7110); // Bogota (north)
@@ -224,3 +280,21 @@ describe('calculateHeading', () => {
     }
   });
 });
+
+describe('calculateLineHeadings', () => {
+  it('should match calculateHeading for each line', () => {
+    const lines: [number, number][][] = [
+      [[0, 0], [0, 100]],
+      [[0, 0], [50, 50], [100, 0]],
+      [[10, 10], [-90, -90]],
+    ];
+
+    const headings = calculateLineHeadings(lines);
+
+    expect(headings).toHaveLength(3);
+    for (let i = 0; i < lines.length; i++) {
+      const line = lines[i];
+      expect(headings[i]).toBeCloseTo(calculateHeading(line[0], line[line.length - 1]), 10);
+    }
+  });
+});
@@ -6,9 +6,15 @@
 import proj4 from 'proj4';
 import type { Coordinate } from '../../types';
 
+const RAD_TO_DEG = 180 / Math.PI;
+
 export interface CoordinateTransformer {
   toUtm: (lon: number, lat: number) => [number, number];
   toWgs84: (x: number, y: number) => [number, number];
+  /** Convert a whole list of WGS84 coordinates to UTM in one call. */
+  toUtmBatch: (coords: Coordinate[]) => [number, number][];
+  /** Convert a whole batch of UTM samples to WGS84 in one call. */
+  toWgs84Batch: (xs: ArrayLike<number>, ys: ArrayLike<number>) => { lons: Float64Array; lats: Float64Array };
   utmZone: number;
 }
 
@@ -19,6 +25,11 @@ export function getUtmZone(lon: number): number {
   return Math.floor((lon + 180) / 6) + 1;
 }
 
+// Transformers are reused across missions in the same UTM zone/hemisphere,
+// so proj4 only parses the projection definitions once per zone. Keyed by
+// +zone (north) / -zone (south); at most 120 entries, so no eviction is needed.
+const transformerCache = new Map<number, CoordinateTransformer>();
+
 /**
  * Create coordinate transformers for a given center point.
  * Returns functions to convert between WGS84 and UTM.
@@ -27,6 +38,12 @@ export function createTransformer(centerLon: number, centerLat: number): Coordin
   const zone = getUtmZone(centerLon);
   const hemisphere = centerLat >= 0 ? 'north' : 'south';
 
+  const cacheKey = hemisphere === 'north' ? zone : -zone;
+  const cached = transformerCache.get(cacheKey);
+  if (cached) {
+    return cached;
+  }
+
   // Define the projections
   const wgs84 = 'EPSG:4326';
   const southParam = hemisphere === 'south' ? '+south ' : '';
@@ -35,13 +52,15 @@ export function createTransformer(centerLon: number, centerLat: number): Coordin
   console.log('[CoordTransformer] Creating transformer for zone', zone, hemisphere);
   console.log('[CoordTransformer] UTM proj:', utmProj);
 
-  return {
+  const converter = proj4(wgs84, utmProj);
+
+  const transformer: CoordinateTransformer = {
     toUtm: (lon: number, lat: number): [number, number] => {
       if (isNaN(lon) || isNaN(lat)) {
         console.error('[CoordTransformer] Invalid input to toUtm:', lon, lat);
         throw new Error(`Invalid coordinates: lon=${lon}, lat=${lat}`);
       }
-      const result = proj4(wgs84, utmProj, [lon, lat]);
+      const result = converter.forward([lon, lat]);
       if (isNaN(result[0]) || isNaN(result[1])) {
         console.error('[CoordTransformer] proj4 returned NaN for:', lon, lat, '-> result:', result);
         throw new Error(`Coordinate transformation failed for lon=${lon}, lat=${lat}`);
@@ -53,43 +72,106 @@ export function createTransformer(centerLon: number, centerLat: number): Coordin
         console.error('[CoordTransformer] Invalid input to toWgs84:', x, y);
         throw new Error(`Invalid UTM coordinates: x=${x}, y=${y}`);
       }
-      const result = proj4(utmProj, wgs84, [x, y]);
+      const result = converter.inverse([x, y]);
       if (isNaN(result[0]) || isNaN(result[1])) {
         console.error('[CoordTransformer] proj4 returned NaN for UTM:', x, y, '-> result:', result);
         throw new Error(`Coordinate transformation failed for x=${x}, y=${y}`);
       }
       return [result[0], result[1]];
     },
+    toUtmBatch: (coords: Coordinate[]): [number, number][] => {
+      const n = coords.length;
+      const result: [number, number][] = new Array(n);
+      // One scratch input for the whole batch instead of a tuple per point
+      const point = [0, 0];
+      for (let i = 0; i < n; i++) {
+        const lon = coords[i].longitude;
+        const lat = coords[i].latitude;
+        if (isNaN(lon) || isNaN(lat)) {
+          console.error('[CoordTransformer] Invalid input to toUtmBatch at', i, ':', lon, lat);
+          throw new Error(`Invalid coordinates: lon=${lon}, lat=${lat}`);
+        }
+        point[0] = lon;
+        point[1] = lat;
+        const utm = converter.forward(point);
+        if (isNaN(utm[0]) || isNaN(utm[1])) {
+          console.error('[CoordTransformer] proj4 returned NaN for:', lon, lat, '-> result:', utm);
+          throw new Error(`Coordinate transformation failed for lon=${lon}, lat=${lat}`);
+        }
+        result[i] = [utm[0], utm[1]];
+      }
+      return result;
+    },
+    toWgs84Batch: (xs: ArrayLike<number>, ys: ArrayLike<number>) => {
+      const n = xs.length;
+      const lons = new Float64Array(n);
+      const lats = new Float64Array(n);
+      // One scratch input for the whole batch instead of a tuple per point
+      const point = [0, 0];
+      for (let i = 0; i < n; i++) {
+        const x = xs[i];
+        const y = ys[i];
+        if (isNaN(x) || isNaN(y)) {
+          console.error('[CoordTransformer] Invalid input to toWgs84Batch at', i, ':', x, y);
+          throw new Error(`Invalid UTM coordinates: x=${x}, y=${y}`);
+        }
+        point[0] = x;
+        point[1] = y;
+        const result = converter.inverse(point);
+        if (isNaN(result[0]) || isNaN(result[1])) {
+          console.error('[CoordTransformer] proj4 returned NaN for UTM:', x, y, '-> result:', result);
+          throw new Error(`Coordinate transformation failed for x=${x}, y=${y}`);
+        }
+        lons[i] = result[0];
+        lats[i] = result[1];
+      }
+      return { lons, lats };
+    },
     utmZone: zone,
   };
+
+  transformerCache.set(cacheKey, transformer);
+  return transformer;
 }
 
 /**
- * Convert an array of WGS84 coordinates to UTM.
+ * Convert an array of WGS84 coordinates to UTM in a single batch call.
  */
 export function coordsToUtm(
   coords: Coordinate[],
   transformer: CoordinateTransformer
 ): [number, number][] {
-  return coords.map(c => transformer.toUtm(c.longitude, c.latitude));
+  return transformer.toUtmBatch(coords);
 }
 
 /**
  * Convert an array of UTM coordinates to WGS84.
+ * Output is preallocated and filled in one pass (proj4 has no array API).
  */
 export function coordsToWgs84(
   coords: [number, number][],
   transformer: CoordinateTransformer
 ): [number, number][] {
-  return coords.map(([x, y]) => transformer.toWgs84(x, y));
+  const toWgs84 = transformer.toWgs84;
+  const n = coords.length;
+  const result: [number, number][] = new Array(n);
+  for (let i = 0; i < n; i++) {
+    result[i] = toWgs84(coords[i][0], coords[i][1]);
+  }
+  return result;
 }
 
 /**
  * Calculate the center point of a set of coordinates.
  */
 export function calculateCenter(coords: Coordinate[]): { lon: number; lat: number } {
-  const sumLon = coords.reduce((sum, c) => sum + c.longitude, 0);
-  const sumLat = coords.reduce((sum, c) => sum + c.latitude, 0);
+  // Single pass over the input, accumulating both sums
+  let sumLon = 0;
+  let sumLat = 0;
+  for (let i = 0; i < coords.length; i++) {
+    sumLon += coords[i].longitude;
+    sumLat += coords[i].latitude;
+  }
   return {
     lon: sumLon / coords.length,
     lat: sumLat / coords.length,
@@ -104,6 +186,22 @@ export function calculateHeading(from: [number, number], to: [number, number]):
   const dx = to[0] - from[0];
   const dy = to[1] - from[1];
   const headingRad = Math.atan2(dx, dy); // atan2(x,y) for heading from north
-  let heading = headingRad * (180 / Math.PI);
-  return ((heading % 360) + 360) % 360;
+  // atan2 is bounded to [-180, 180] degrees, so a single shifted modulo normalizes it
+  return (headingRad * RAD_TO_DEG + 360) % 360;
+}
+
+/**
+ * Calculate the heading (0-360) of each line, from its first to its last point.
+ * Computes all headings of a pattern in one pass into a typed array.
+ */
+export function calculateLineHeadings(lines: [number, number][][]): Float64Array {
+  const headings = new Float64Array(lines.length);
+  for (let i = 0; i < lines.length; i++) {
+    const line = lines[i];
+    if (line.length < 2) continue;
+    const from = line[0];
+    const to = line[line.length - 1];
+    headings[i] = (Math.atan2(to[0] - from[0], to[1] - from[1]) * RAD_TO_DEG + 360) % 360;
+  }
+  return headings;
 }
@@ -24,20 +24,34 @@ const createWaypoint = (
   take_photo: true,
 });
 
+// Two-waypoint mission shared by the read-only packaging tests
+const TWO_WAYPOINTS: Waypoint[] = [
+  createWaypoint(0, -74.07, 4.71),
+  createWaypoint(1, -74.07, 4.72),
+];
+
 // Helper to convert Blob to ArrayBuffer for JSZip in Node environment
 async function blobToArrayBuffer(blob: Blob): Promise<ArrayBuffer> {
   return await blob.arrayBuffer();
 }
 
+// KMZ of TWO_WAYPOINTS, packaged and unzipped once for the tests that only
+// read its entries
+let twoWaypointKmz: Promise<JSZip> | null = null;
+const loadTwoWaypointKmz = (): Promise<JSZip> => {
+  if (!twoWaypointKmz) {
+    twoWaypointKmz = new KMZPackager('mini_4_pro', TWO_WAYPOINTS)
+      .createKmz()
+      .then(blobToArrayBuffer)
+      .then(arrayBuffer => JSZip.loadAsync(arrayBuffer));
+  }
+  return twoWaypointKmz;
+};
+
 describe('KMZPackager', () => {
   describe('createKmz', () => {
     it('should create a valid KMZ blob', async () => {
-      const waypoints = [
-        createWaypoint(0, -74.07, 4.71),
-        createWaypoint(1, -74.07, 4.72),
-      ];
-
-      const packager = new KMZPackager('mini_4_pro', waypoints);
+      const packager = new KMZPackager('mini_4_pro', TWO_WAYPOINTS);
       const blob = await packager.createKmz('goHome');
 
       expect(blob).toBeInstanceOf(Blob);
@@ -45,17 +59,7 @@ describe('KMZPackager', () => {
     });
 
     it('should contain template.kml and waylines.wpml', async () => {
-      const waypoints = [
-        createWaypoint(0, -74.07, 4.71),
-        createWaypoint(1, -74.07, 4.72),
-      ];
-
-      const packager = new KMZPackager('mini_4_pro', waypoints);
-      const blob = await packager.createKmz();
-
-      // Convert Blob to ArrayBuffer for JSZip in Node
-      const arrayBuffer = await blobToArrayBuffer(blob);
-      const zip = await JSZip.loadAsync(arrayBuffer);
+      const zip = await loadTwoWaypointKmz();
       const files = Object.keys(zip.files);
 
       expect(files).toContain('wpmz/template.kml');
@@ -63,13 +67,7 @@ describe('KMZPackager', () => {
     });
 
     it('should have valid XML in template.kml', async () => {
-      const waypoints = [createWaypoint(0, -74.07, 4.71)];
-
-      const packager = new KMZPackager('mini_4_pro', waypoints);
-      const blob = await packager.createKmz();
-
-      const arrayBuffer = await blobToArrayBuffer(blob);
-      const zip = await JSZip.loadAsync(arrayBuffer);
+      const zip = await loadTwoWaypointKmz();
       const templateKml = await zip.file('wpmz/template.kml')?.async('string');
 
       expect(templateKml).toContain('<?xml version="1.0"');
@@ -77,10 +75,18 @@ describe('KMZPackager', () => {
     });
 
     it('should have valid XML in waylines.wpml', async () => {
-      const waypoints = [
-        createWaypoint(0, -74.07, 4.71),
-        createWaypoint(1, -74.07, 4.72),
-      ];
+      const zip = await loadTwoWaypointKmz();
+      const waylinesWpml = await zip.file('wpmz/waylines.wpml')?.async('string');
+
+      expect(waylinesWpml).toContain('<Placemark>');
+      expect(waylinesWpml).toContain('<wpml:index>0</wpml:index>');
+      expect(waylinesWpml).toContain('<wpml:index>1</wpml:index>');
+    });
+
+    it('should produce a readable KMZ for larger (compressed) missions', async () => {
+      const waypoints = Array.from({ length: 60 }, (_, i) =>
+        createWaypoint(i, -74.07, 4.71 + i * 0.0001)
+      );
 
       const packager = new KMZPackager('mini_4_pro', waypoints);
       const blob = await packager.createKmz();
@@ -89,9 +95,30 @@ describe('KMZPackager', () => {
       const zip = await JSZip.loadAsync(arrayBuffer);
       const waylinesWpml = await zip.file('wpmz/waylines.wpml')?.async('string');
 
-      expect(waylinesWpml).toContain('<Placemark>');
-      expect(waylinesWpml).toContain('<wpml:index>0</wpml:index>');
-      expect(waylinesWpml).toContain('<wpml:index>1</wpml:index>');
+      expect(waylinesWpml).toContain('<wpml:index>59</wpml:index>');
+    });
+
+    // Canary for placemark writer regressions that scale with waypoint count
+    it.each([4, 2000])('should package a %i-waypoint mission', async (count) => {
+      const waypoints = Array.from({ length: count }, (_, i) =>
+        createWaypoint(i, -74.07, 4.71 + i * 0.0001)
+      );
+
+      const packager = new KMZPackager('mini_4_pro', waypoints);
+      const blob = await packager.createKmz();
+
+      const arrayBuffer = await blobToArrayBuffer(blob);
+      const zip = await JSZip.loadAsync(arrayBuffer);
+      expect(Object.keys(zip.files)).toEqual(
+        expect.arrayContaining(['wpmz/template.kml', 'wpmz/waylines.wpml'])
+      );
+      const waylinesWpml = (await zip.file('wpmz/waylines.wpml')?.async('string')) ?? '';
+
+      // takePhoto + gimbalRotate on the first waypoint, one gimbalEvenlyRotate
+      // on every waypoint but the last: count + 1 actions, numbered from 1
+      expect((waylinesWpml.match(/<Placemark>/g) || []).length).toBe(count);
+      expect((waylinesWpml.match(/<wpml:actionId>/g) || []).length).toBe(count + 1);
+      expect(waylinesWpml).toContain(`<wpml:actionId>${count + 1}</wpml:actionId>`);
     });
 
     it('should respect finish action parameter', async () => {
@@ -159,6 +186,19 @@ describe('KMZPackager', () => {
       expect(stats.estimatedDistanceM).toBeLessThan(1200);
     });
 
+    it('should include altitude changes in the distance', () => {
+      const waypoints = [
+        createWaypoint(0, -74.07, 4.71),
+        createWaypoint(1, -74.07, 4.71),
+      ];
+      waypoints[1].altitude = 90; // 30m straight up
+
+      const packager = new KMZPackager('mini_4_pro', waypoints);
+      const stats = packager.getMissionStats();
+
+      expect(stats.estimatedDistanceM).toBeCloseTo(30, 5);
+    });
+
     it('should return zeros for empty waypoints', () => {
       const packager = new KMZPackager('mini_4_pro', []);
       const stats = packager.getMissionStats();
@@ -7,6 +7,12 @@ import JSZip from 'jszip';
 import type { Waypoint, DroneModel, FinishAction } from '../../types';
 import { WPMLBuilder } from './wpmlBuilder';
 
+// Missions below this size are stored uncompressed in the KMZ
+const STORE_MAX_WAYPOINTS = 50;
+
+const EARTH_RADIUS_M = 6371000;
+const DEG_TO_RAD = Math.PI / 180;
+
 export class KMZPackager {
   private waypoints: Waypoint[];
   private builder: WPMLBuilder;
@@ -34,25 +40,21 @@ export class KMZPackager {
     // Get gimbal pitch from first waypoint (default -90 for nadir/photogrammetry)
     const gimbalPitch = this.waypoints[0]?.gimbal_pitch ?? -90;
 
-    // Generate XML content
-    const templateKml = this.builder.buildTemplateKml(finishAction);
-    const waylinesWpml = this.builder.buildWaylinesWpml(gimbalPitch);
-
     // Create ZIP in memory
     const zip = new JSZip();
 
-    // Add template.kml in wpmz folder
-    zip.file('wpmz/template.kml', templateKml);
-
-    // Add waylines.wpml in wpmz folder
-    zip.file('wpmz/waylines.wpml', waylinesWpml);
+    // Add the XML files in the wpmz folder. They are handed to JSZip already
+    // UTF-8 encoded (native TextEncoder) so it stores the bytes as-is instead of
+    // keeping the strings around and running its own JS encoder at generate time.
+    zip.file('wpmz/template.kml', this.builder.buildTemplateKmlBytes(finishAction));
+    zip.file('wpmz/waylines.wpml', this.builder.buildWaylinesWpmlBytes(gimbalPitch));
 
-    // Generate the ZIP file as a Blob
-    const blob = await zip.generateAsync({
-      type: 'blob',
-      compression: 'DEFLATE',
-      compressionOptions: { level: 6 },
-    });
+    // Generate the ZIP file as a Blob. Small missions are only a few KB of XML,
+    // so compressing them costs more CPU than it saves; larger ones use fast DEFLATE.
+    const options: JSZip.JSZipGeneratorOptions<'blob'> = this.waypoints.length < STORE_MAX_WAYPOINTS
+      ? { type: 'blob', compression: 'STORE' }
+      : { type: 'blob', compression: 'DEFLATE', compressionOptions: { level: 1 } };
+    const blob = await zip.generateAsync(options);
 
     return blob;
   }
@@ -73,22 +75,35 @@ export class KMZPackager {
       };
     }
 
-    // Calculate total distance
+    // Single pass over the waypoints: accumulate distance and photo count together.
+    // cos(lat) is carried over from the previous point so each waypoint pays for one cos.
+    const waypoints = this.waypoints;
     let totalDistance = 0;
-    const photoCount = this.waypoints.filter(wp => wp.take_photo).length;
-
-    for (let i = 1; i < this.waypoints.length; i++) {
-      const prev = this.waypoints[i - 1];
-      const curr = this.waypoints[i];
-
-      // Simple distance calculation (Euclidean approximation for small areas)
-      const latDiff = (curr.latitude - prev.latitude) * 111320; // meters per degree lat
-      const lonDiff = (curr.longitude - prev.longitude) * 111320 *
-        Math.cos(((curr.latitude + prev.latitude) / 2) * (Math.PI / 180));
-      const altDiff = curr.altitude - prev.altitude;
-
-      const distance = Math.sqrt(latDiff ** 2 + lonDiff ** 2 + altDiff ** 2);
-      totalDistance += distance;
+    let photoCount = waypoints[0].take_photo ? 1 : 0;
+    let prevLatRad = waypoints[0].latitude * DEG_TO_RAD;
+    let prevLonRad = waypoints[0].longitude * DEG_TO_RAD;
+    let prevCosLat = Math.cos(prevLatRad);
+    let prevAlt = waypoints[0].altitude;
+
+    for (let i = 1; i < waypoints.length; i++) {
+      const curr = waypoints[i];
+      if (curr.take_photo) photoCount++;
+
+      // Haversine ground distance, combined with the altitude change
+      const latRad = curr.latitude * DEG_TO_RAD;
+      const lonRad = curr.longitude * DEG_TO_RAD;
+      const cosLat = Math.cos(latRad);
+      const sinHalfDLat = Math.sin((latRad - prevLatRad) / 2);
+      const sinHalfDLon = Math.sin((lonRad - prevLonRad) / 2);
+      const a = sinHalfDLat * sinHalfDLat + prevCosLat * cosLat * sinHalfDLon * sinHalfDLon;
+      const ground = 2 * EARTH_RADIUS_M * Math.asin(Math.sqrt(Math.min(1, a)));
+
+      totalDistance += Math.hypot(ground, curr.altitude - prevAlt);
+
+      prevLatRad = latRad;
+      prevLonRad = lonRad;
+      prevCosLat = cosLat;
+      prevAlt = curr.altitude;
     }
 
     return {
@@ -0,0 +1,50 @@
+/**
+ * Tests for line sampling
+ */
+
+import { describe, it, expect } from 'vitest';
+import { sampleLines } from './lineSampler';
+
+describe('sampleLines', () => {
+  it('should sample evenly spaced photos including both endpoints', () => {
+    const { xs, ys, headings } = sampleLines([[[0, 0], [0, 100]]], 25);
+
+    expect(Array.from(xs)).toEqual([0, 0, 0, 0, 0]);
+    expect(Array.from(ys)).toEqual([0, 25, 50, 75, 100]);
+    expect(Array.from(headings)).toEqual([0, 0, 0, 0, 0]);
+  });
+
+  it('should follow every segment of a polyline', () => {
+    const { xs, ys } = sampleLines([[[0, 0], [50, 0], [50, 50]]], 25);
+
+    expect(xs.length).toBe(5);
+    expect(xs[2]).toBeCloseTo(50, 9);
+    expect(ys[2]).toBeCloseTo(0, 9);
+    expect(xs[4]).toBeCloseTo(50, 9);
+    expect(ys[4]).toBeCloseTo(50, 9);
+  });
+
+  it('should use the heading from first to last point of each line', () => {
+    const { headings } = sampleLines([
+      [[0, 0], [100, 0]],
+      [[100, 10], [0, 10]],
+    ], 50);
+
+    expect(Array.from(headings)).toEqual([90, 90, 90, 270, 270, 270]);
+  });
+
+  it('should take at least two photos per line', () => {
+    const { xs } = sampleLines([[[0, 0], [15, 0]]], 20);
+
+    expect(xs.length).toBe(2);
+  });
+
+  it('should skip single-point lines and lines shorter than half the photo spacing', () => {
+    const { xs } = sampleLines([
+      [[0, 0], [5, 0]],
+      [[0, 0]],
+    ], 20);
+
+    expect(xs.length).toBe(0);
+  });
+});
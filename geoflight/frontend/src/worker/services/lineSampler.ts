@@ -0,0 +1,125 @@
+/**
+ * Photo sampling along flight lines.
+ * Shared by the grid and corridor patterns: turns UTM polylines into evenly
+ * spaced photo positions, stored as struct-of-arrays typed buffers.
+ */
+
+import { calculateLineHeadings } from './coordinateTransformer';
+
+export interface LineSamples {
+  xs: Float64Array;
+  ys: Float64Array;
+  headings: Float64Array;
+}
+
+/**
+ * Write the cumulative distance along a polyline at each vertex (0 at the
+ * first vertex) into cumDist, starting at base.
+ */
+function cumulativeDistances(line: [number, number][], cumDist: Float64Array, base: number): void {
+  cumDist[base] = 0;
+  for (let i = 1; i < line.length; i++) {
+    const dx = line[i][0] - line[i - 1][0];
+    const dy = line[i][1] - line[i - 1][1];
+    cumDist[base + i] = cumDist[base + i - 1] + Math.sqrt(dx * dx + dy * dy);
+  }
+}
+
+/**
+ * Sample numPhotos evenly spaced points along a polyline, from its start to its
+ * end, writing them into xs/ys from offset. The line's cumulative distances
+ * are read from cumDist starting at base. The whole batch is resolved in one
+ * forward walk over the segments.
+ */
+function interpolateAlongLine(
+  line: [number, number][],
+  cumDist: Float64Array,
+  base: number,
+  numPhotos: number,
+  xs: Float64Array,
+  ys: Float64Array,
+  offset: number
+): void {
+  const lineLength = cumDist[base + line.length - 1];
+
+  // Sample distances only grow, so the segment index only moves forward
+  let seg = 1;
+  for (let j = 0; j < numPhotos; j++) {
+    const fraction = numPhotos > 1 ? j / (numPhotos - 1) : 0;
+    const targetDist = fraction * lineLength;
+
+    while (seg < line.length && cumDist[base + seg] < targetDist) seg++;
+
+    const k = offset + j;
+    if (seg < line.length) {
+      // Interpolate within the segment that reaches targetDist
+      const dx = line[seg][0] - line[seg - 1][0];
+      const dy = line[seg][1] - line[seg - 1][1];
+      const segLength = Math.sqrt(dx * dx + dy * dy);
+      const t = segLength > 0 ? (targetDist - cumDist[base + seg - 1]) / segLength : 0;
+      xs[k] = line[seg - 1][0] + dx * t;
+      ys[k] = line[seg - 1][1] + dy * t;
+    } else {
+      // Rounding pushed targetDist past the end: use the last vertex
+      xs[k] = line[line.length - 1][0];
+      ys[k] = line[line.length - 1][1];
+    }
+  }
+}
+
+/**
+ * Sample photo positions along every line in flight order.
+ *
+ * Each line gets max(2, floor(length / photoSpacing) + 1) evenly spaced photos
+ * (lines shorter than half a spacing are skipped) and carries the heading from
+ * its first to its last point. All lines are sampled in two flat passes:
+ * one to size the output buffers, one to fill them. Segment lengths are
+ * measured once, into a single buffer shared by all lines.
+ */
+export function sampleLines(lines: [number, number][][], photoSpacing: number): LineSamples {
+  const lineHeadings = calculateLineHeadings(lines);
+
+  // Every vertex of every line gets one slot in a shared cumulative distance buffer
+  const lineBase = new Int32Array(lines.length);
+  let vertexCount = 0;
+  for (let l = 0; l < lines.length; l++) {
+    lineBase[l] = vertexCount;
+    vertexCount += lines[l].length;
+  }
+  const cumDist = new Float64Array(vertexCount);
+
+  // First pass: cumulative distances and photos per line, so the sample
+  // buffers can be preallocated
+  const photosPerLine = new Int32Array(lines.length);
+  let total = 0;
+  for (let l = 0; l < lines.length; l++) {
+    const line = lines[l];
+    if (line.length < 2) continue;
+
+    cumulativeDistances(line, cumDist, lineBase[l]);
+    const lineLength = cumDist[lineBase[l] + line.length - 1];
+
+    if (lineLength < photoSpacing / 2) continue;
+
+    const numPhotos = Math.max(2, Math.floor(lineLength / photoSpacing) + 1);
+    photosPerLine[l] = numPhotos;
+    total += numPhotos;
+  }
+
+  // Second pass: sample every line into struct-of-arrays UTM buffers
+  const xs = new Float64Array(total);
+  const ys = new Float64Array(total);
+  const headings = new Float64Array(total);
+  let k = 0;
+
+  for (let l = 0; l < lines.length; l++) {
+    const numPhotos = photosPerLine[l];
+    if (numPhotos === 0) continue;
+
+    interpolateAlongLine(lines[l], cumDist, lineBase[l], numPhotos, xs, ys, k);
+    headings.fill(lineHeadings[l], k, k + numPhotos);
+    k += numPhotos;
+  }
+
+  return { xs, ys, headings };
+}
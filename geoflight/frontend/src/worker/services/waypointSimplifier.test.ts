@@ -115,6 +115,61 @@ describe('simplifyWaypoints', () => {
         resultLowThreshold.waypoints.length
       );
     });
+
+    it('should measure heading changes the short way across north', () => {
+      const waypoints = [
+        createWaypoint(0, -74.07, 4.71, 355),
+        createWaypoint(1, -74.07, 4.72, 355),
+        createWaypoint(2, -74.07, 4.73, 5),   // 10 degree change, not 350
+        createWaypoint(3, -74.07, 4.74, 5),
+      ];
+
+      const result = simplifyWaypoints(waypoints, {
+        enabled: true,
+        angleThresholdDeg: 15,
+      });
+
+      expect(result.waypoints).toHaveLength(2);
+    });
+  });
+
+  describe('tolerance-based simplification (Douglas-Peucker)', () => {
+    it('should drop collinear waypoints even when headings differ', () => {
+      const waypoints = [
+        createWaypoint(0, -74.07, 4.71, 0),
+        createWaypoint(1, -74.07, 4.72, 40),  // Heading noise on a straight line
+        createWaypoint(2, -74.07, 4.73, 0),
+        createWaypoint(3, -74.07, 4.74, 0),
+      ];
+
+      const result = simplifyWaypoints(waypoints, {
+        enabled: true,
+        angleThresholdDeg: 15,
+        toleranceM: 1,
+      });
+
+      expect(result.waypoints.map(wp => wp.latitude)).toEqual([4.71, 4.74]);
+    });
+
+    it('should keep corners farther than the tolerance from the chord', () => {
+      const waypoints = [
+        createWaypoint(0, -74.07, 4.71, 0),
+        createWaypoint(1, -74.07, 4.72, 0),
+        createWaypoint(2, -74.07, 4.73, 90),  // Corner (~1.1 km off the chord)
+        createWaypoint(3, -74.06, 4.73, 90),
+        createWaypoint(4, -74.05, 4.73, 90),
+      ];
+
+      const result = simplifyWaypoints(waypoints, {
+        enabled: true,
+        angleThresholdDeg: 15,
+        toleranceM: 5,
+      });
+
+      expect(result.waypoints).toHaveLength(3);
+      expect(result.waypoints[1].latitude).toBe(4.73);
+      expect(result.waypoints[1].longitude).toBe(-74.07);
+    });
   });
 
   describe('distance constraints', () => {
@@ -149,6 +204,26 @@ describe('simplifyWaypoints', () => {
       // With constraint: more intermediate points should be kept
       expect(resultWithConstraint.waypoints.length).toBeGreaterThan(2);
     });
+
+    it('should restart distance spacing at every turn', () => {
+      const waypoints = [
+        createWaypoint(0, -74.07, 4.71, 0),
+        createWaypoint(1, -74.07, 4.715, 0),
+        createWaypoint(2, -74.07, 4.72, 90),  // Turn - kept with the waypoint before it
+        createWaypoint(3, -74.065, 4.72, 90),
+        createWaypoint(4, -74.06, 4.72, 90),
+        createWaypoint(5, -74.055, 4.72, 90),
+      ];
+
+      const result = simplifyWaypoints(waypoints, {
+        enabled: true,
+        angleThresholdDeg: 15,
+        maxDistanceBetweenM: 1000,
+      });
+
+      // Turn keeps 1 and 2; spacing from 2 keeps 4 (~1.1 km); 5 is the last
+      expect(result.waypoints.map(wp => wp.longitude)).toEqual([-74.07, -74.07, -74.07, -74.06, -74.055]);
+    });
   });
 
   describe('time constraints', () => {
@@ -16,68 +16,285 @@ export interface SimplificationOptions {
   maxDistanceBetweenM?: number;
   maxTimeBetweenS?: number;
   speedMs?: number;
+  /** Spatial tolerance (m); when set, Douglas-Peucker replaces the heading rule. */
+  toleranceM?: number;
 }
 
+const EARTH_RADIUS_M = 6371000; // Earth's radius in meters
+const DEG_TO_RAD = Math.PI / 180;
+
 /**
- * Haversine distance between two points in meters.
+ * Haversine distance between two points in meters, given the cosine of each
+ * latitude (precomputed once per waypoint by the caller).
  */
-function haversineDistance(lat1: number, lon1: number, lat2: number, lon2: number): number {
-  const R = 6371000; // Earth's radius in meters
-
-  const lat1Rad = lat1 * (Math.PI / 180);
-  const lat2Rad = lat2 * (Math.PI / 180);
-  const deltaLat = (lat2 - lat1) * (Math.PI / 180);
-  const deltaLon = (lon2 - lon1) * (Math.PI / 180);
+function haversineDistance(
+  lat1: number,
+  lon1: number,
+  cosLat1: number,
+  lat2: number,
+  lon2: number,
+  cosLat2: number
+): number {
+  const deltaLat = (lat2 - lat1) * DEG_TO_RAD;
+  const deltaLon = (lon2 - lon1) * DEG_TO_RAD;
 
   const a =
     Math.sin(deltaLat / 2) ** 2 +
-    Math.cos(lat1Rad) * Math.cos(lat2Rad) * Math.sin(deltaLon / 2) ** 2;
+    cosLat1 * cosLat2 * Math.sin(deltaLon / 2) ** 2;
   const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
 
-  return R * c;
+  return EARTH_RADIUS_M * c;
+}
+
+// Slack on the path-length bound so rounding can never skip a haversine check
+const PATH_BOUND_SLACK = 1 + 1e-9;
+
+/**
+ * Cheap upper bound (m) on the haversine distance of one step: the length of
+ * the path along the start's parallel, then along the meridian. Summed over
+ * consecutive steps it bounds the straight distance from where the sum started,
+ * so while it stays below maxDist no waypoint can reach maxDist and the
+ * haversine check can be skipped.
+ */
+function stepDistanceBound(
+  lat1: number,
+  lon1: number,
+  cosLat1: number,
+  lat2: number,
+  lon2: number
+): number {
+  return (Math.abs(lat2 - lat1) + cosLat1 * Math.abs(lon2 - lon1)) * DEG_TO_RAD * EARTH_RADIUS_M;
+}
+
+/**
+ * Struct-of-arrays view of the fields the simplifier scans. The scans read
+ * contiguous typed columns instead of hopping between waypoint objects; the
+ * objects themselves are only touched again to build the kept list.
+ */
+interface WaypointColumns {
+  lons: Float64Array;
+  lats: Float64Array;
+  headings: Float64Array;
+  speeds: Float64Array;
+}
+
+function toColumns(waypoints: Waypoint[]): WaypointColumns {
+  const n = waypoints.length;
+  const lons = new Float64Array(n);
+  const lats = new Float64Array(n);
+  const headings = new Float64Array(n);
+  const speeds = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    const wp = waypoints[i];
+    lons[i] = wp.longitude;
+    lats[i] = wp.latitude;
+    headings[i] = wp.heading;
+    speeds[i] = wp.speed;
+  }
+  return { lons, lats, headings, speeds };
+}
+
+/**
+ * Indices of the set flags in a keep mask, in ascending order.
+ */
+function flaggedIndices(mask: Uint8Array): Int32Array {
+  let count = 0;
+  for (let i = 0; i < mask.length; i++) count += mask[i];
+
+  const indices = new Int32Array(count);
+  let k = 0;
+  for (let i = 0; i < mask.length; i++) {
+    if (mask[i]) indices[k++] = i;
+  }
+  return indices;
 }
 
 /**
- * Find indices of critical waypoints (turns and endpoints).
+ * Flag critical waypoints (turns and endpoints) in a keep mask, together with
+ * any intermediate waypoints needed for the spacing constraints.
+ *
  * A waypoint is critical if:
  * - It's the first or last waypoint
- * - Its heading differs significantly from the previous waypoint
+ * - Its heading differs significantly from the previous waypoint (the waypoint
+ *   before the turn is kept too)
+ *
+ * Turn detection and spacing insertion run in one fused pass: each heading
+ * change is evaluated once (looking one waypoint ahead), and between critical
+ * waypoints a waypoint is kept once it is maxDist or more from the last kept one.
+ * The haversine distance is only evaluated once the path-length bound since
+ * the last kept waypoint reaches maxDist.
  */
-function findCriticalWaypoints(waypoints: Waypoint[], angleThresholdDeg: number): Set<number> {
-  const critical = new Set<number>([0, waypoints.length - 1]); // Always keep first and last
+function scanHeadingMask(
+  columns: WaypointColumns,
+  angleThresholdDeg: number,
+  maxDistanceM: number | undefined,
+  maxTimeS: number | undefined,
+  defaultSpeedMs: number
+): Uint8Array {
+  const { lons, lats, headings, speeds } = columns;
+  const n = lats.length;
+  const keep = new Uint8Array(n);
+  const hasSpacing = maxDistanceM !== undefined || maxTimeS !== undefined;
 
-  for (let i = 1; i < waypoints.length; i++) {
-    const prevHeading = waypoints[i - 1].heading;
-    const currHeading = waypoints[i].heading;
+  let turnBefore = false;
+  let lastKeptIdx = 0;
+  let maxDist: number | undefined;
+  let lastCosLat = 0;
+  let prevCosLat = 0;
+  // Upper bound on the distance from the last kept waypoint
+  let pathBound = 0;
 
-    // Calculate heading difference (handle 360/0 wrap-around)
-    let diff = Math.abs(currHeading - prevHeading);
-    if (diff > 180) {
-      diff = 360 - diff;
+  for (let j = 0; j < n; j++) {
+    let turnAfter = false;
+    if (j < n - 1) {
+      // Calculate heading difference (handle 360/0 wrap-around); Math.min
+      // picks the shorter way round without a data-dependent branch
+      const diff = Math.abs(headings[j + 1] - headings[j]);
+      turnAfter = Math.min(diff, 360 - diff) >= angleThresholdDeg;
     }
 
-    if (diff >= angleThresholdDeg) {
-      // Keep both the waypoint before the turn and the turn waypoint
-      critical.add(i - 1);
-      critical.add(i);
+    let cosLat = 0;
+    if (hasSpacing) {
+      cosLat = Math.cos(lats[j] * DEG_TO_RAD);
+      if (j > 0) {
+        pathBound += stepDistanceBound(lats[j - 1], lons[j - 1], prevCosLat, lats[j], lons[j]);
+      }
     }
+
+    if (j === 0 || j === n - 1 || turnBefore || turnAfter) {
+      keep[j] = 1;
+      lastKeptIdx = j;
+      if (hasSpacing) {
+        lastCosLat = cosLat;
+        pathBound = 0;
+        // Max allowed distance for the stretch starting here; time-based
+        // spacing uses the speed of this waypoint
+        maxDist = maxTimeS !== undefined
+          ? maxTimeS * (speeds[j] || defaultSpeedMs)
+          : maxDistanceM;
+      }
+    } else if (maxDist && pathBound * PATH_BOUND_SLACK >= maxDist) {
+      const dist = haversineDistance(
+        lats[lastKeptIdx],
+        lons[lastKeptIdx],
+        lastCosLat,
+        lats[j],
+        lons[j],
+        cosLat
+      );
+
+      // If we've exceeded max distance, add this waypoint
+      if (dist >= maxDist) {
+        keep[j] = 1;
+        lastKeptIdx = j;
+        lastCosLat = cosLat;
+        pathBound = 0;
+      }
+    }
+
+    turnBefore = turnAfter;
+    prevCosLat = cosLat;
   }
 
-  return critical;
+  return keep;
 }
 
 /**
- * Add intermediate waypoints to maintain spacing constraints.
+ * Flag the waypoints kept by Douglas-Peucker simplification in a keep mask.
+ *
+ * Positions are projected to local planar meters (equirectangular around the
+ * first waypoint), then every span is split at its farthest waypoint from the
+ * chord until no waypoint is more than toleranceM off its simplified segment.
+ * Uses an explicit stack instead of recursion, so long missions cannot
+ * overflow the call stack.
+ */
+function douglasPeuckerMask(columns: WaypointColumns, toleranceM: number): Uint8Array {
+  const { lons, lats } = columns;
+  const n = lats.length;
+  const keep = new Uint8Array(n);
+  if (n === 0) return keep;
+  keep[0] = 1;
+  keep[n - 1] = 1;
+
+  const lon0 = lons[0];
+  const lat0 = lats[0];
+  const kx = Math.cos(lat0 * DEG_TO_RAD) * DEG_TO_RAD * EARTH_RADIUS_M;
+  const ky = DEG_TO_RAD * EARTH_RADIUS_M;
+  const xs = new Float64Array(n);
+  const ys = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    xs[i] = (lons[i] - lon0) * kx;
+    ys[i] = (lats[i] - lat0) * ky;
+  }
+
+  const toleranceSq = toleranceM * toleranceM;
+  // Pending [start, end] spans; at most one entry per waypoint is ever pushed
+  const stack = new Int32Array(2 * n);
+  let top = 0;
+  stack[top++] = 0;
+  stack[top++] = n - 1;
+
+  while (top > 0) {
+    const end = stack[--top];
+    const start = stack[--top];
+    if (end - start < 2) continue;
+
+    const ax = xs[start], ay = ys[start];
+    const dx = xs[end] - ax;
+    const dy = ys[end] - ay;
+    const lenSq = dx * dx + dy * dy;
+
+    // Farthest waypoint from the chord (or from start, for a closed span)
+    let maxDistSq = -1;
+    let split = start;
+    for (let i = start + 1; i < end; i++) {
+      let px = xs[i] - ax;
+      let py = ys[i] - ay;
+      if (lenSq > 0) {
+        const t = Math.max(0, Math.min(1, (px * dx + py * dy) / lenSq));
+        px -= t * dx;
+        py -= t * dy;
+      }
+      const distSq = px * px + py * py;
+      if (distSq > maxDistSq) {
+        maxDistSq = distSq;
+        split = i;
+      }
+    }
+
+    if (maxDistSq > toleranceSq) {
+      keep[split] = 1;
+      stack[top++] = start;
+      stack[top++] = split;
+      stack[top++] = split;
+      stack[top++] = end;
+    }
+  }
+
+  return keep;
+}
+
+/**
+ * Add intermediate waypoints to maintain spacing constraints, marking them in
+ * the same keep mask.
  */
 function addIntermediateWaypoints(
-  waypoints: Waypoint[],
-  criticalIndices: Set<number>,
+  columns: WaypointColumns,
+  critical: Uint8Array,
   maxDistanceM: number | undefined,
   maxTimeS: number | undefined,
   defaultSpeedMs: number
-): Set<number> {
-  const result = new Set(criticalIndices);
-  const sortedCritical = Array.from(criticalIndices).sort((a, b) => a - b);
+): void {
+  // Snapshot the turn/endpoint indices (already in order) before marking
+  // intermediates in the same mask
+  const sortedCritical = flaggedIndices(critical);
+  const { lons, lats, speeds } = columns;
+
+  // cos(latitude) of every waypoint, computed once for all distance checks
+  const cosLat = new Float64Array(lats.length);
+  for (let i = 0; i < lats.length; i++) {
+    cosLat[i] = Math.cos(lats[i] * DEG_TO_RAD);
+  }
 
   for (let i = 0; i < sortedCritical.length - 1; i++) {
     const startIdx = sortedCritical[i];
@@ -92,7 +309,7 @@ function addIntermediateWaypoints(
     let maxDist = maxDistanceM;
     if (maxTimeS !== undefined) {
       // Use the speed from the start waypoint for time-based calculation
-      const speed = waypoints[startIdx].speed || defaultSpeedMs;
+      const speed = speeds[startIdx] || defaultSpeedMs;
       maxDist = maxTimeS * speed;
     }
 
@@ -102,24 +319,64 @@ function addIntermediateWaypoints(
 
     // Add intermediate waypoints as needed
     let lastAddedIdx = startIdx;
+    let pathBound = 0;
 
     for (let j = startIdx + 1; j < endIdx; j++) {
+      // Gaps (or stretches) shorter than maxDist along the path can't need a
+      // waypoint: skip the haversine check
+      pathBound += stepDistanceBound(lats[j - 1], lons[j - 1], cosLat[j - 1], lats[j], lons[j]);
+      if (pathBound * PATH_BOUND_SLACK < maxDist) {
+        continue;
+      }
+
       const dist = haversineDistance(
-        waypoints[lastAddedIdx].latitude,
-        waypoints[lastAddedIdx].longitude,
-        waypoints[j].latitude,
-        waypoints[j].longitude
+        lats[lastAddedIdx],
+        lons[lastAddedIdx],
+        cosLat[lastAddedIdx],
+        lats[j],
+        lons[j],
+        cosLat[j]
       );
 
       // If we've exceeded max distance, add this waypoint
       if (dist >= maxDist) {
-        result.add(j);
+        critical[j] = 1;
         lastAddedIdx = j;
+        pathBound = 0;
       }
     }
   }
+}
 
-  return result;
+/**
+ * Indices (ascending) of the waypoints kept for the given options.
+ */
+function keptIndices(columns: WaypointColumns, options: SimplificationOptions): Int32Array {
+  // The heading rule does both in one pass; the
+  // Douglas-Peucker rule (spatial tolerance) adds spacing in a second pass.
+  let critical: Uint8Array;
+  if (options.toleranceM === undefined) {
+    critical = scanHeadingMask(
+      columns,
+      options.angleThresholdDeg,
+      options.maxDistanceBetweenM,
+      options.maxTimeBetweenS,
+      options.speedMs ?? 5.0
+    );
+  } else {
+    critical = douglasPeuckerMask(columns, options.toleranceM);
+    if (options.maxDistanceBetweenM !== undefined || options.maxTimeBetweenS !== undefined) {
+      addIntermediateWaypoints(
+        columns,
+        critical,
+        options.maxDistanceBetweenM,
+        options.maxTimeBetweenS,
+        options.speedMs ?? 5.0
+      );
+    }
+  }
+
+  return flaggedIndices(critical);
 }
 
 /**
@@ -128,6 +385,7 @@ function addIntermediateWaypoints(
  * The algorithm:
  * 1. Always keep first and last waypoints
  * 2. Detect heading changes >= angle_threshold and keep those waypoints
+ *    (or, with toleranceM, keep what Douglas-Peucker needs to stay within it)
  * 3. If max_distance or max_time is set, add intermediate waypoints
  */
 export function simplifyWaypoints(
@@ -145,32 +403,30 @@ export function simplifyWaypoints(
     return { waypoints, stats: defaultStats };
   }
 
-  // Step 1: Find critical waypoints (turns and endpoints)
-  let criticalIndices = findCriticalWaypoints(waypoints, options.angleThresholdDeg);
+  // Steps 1-2: Find critical waypoints and add intermediate waypoints if
+  // spacing constraints are set
+  const sortedIndices = keptIndices(toColumns(waypoints), options);
 
-  // Step 2: Add intermediate waypoints if spacing constraints are set
-  if (options.maxDistanceBetweenM !== undefined || options.maxTimeBetweenS !== undefined) {
-    criticalIndices = addIntermediateWaypoints(
-      waypoints,
-      criticalIndices,
-      options.maxDistanceBetweenM,
-      options.maxTimeBetweenS,
-      options.speedMs ?? 5.0
-    );
-  }
-
-  // Step 3: Build simplified list
-  const sortedIndices = Array.from(criticalIndices).sort((a, b) => a - b);
-  const simplified: Waypoint[] = sortedIndices.map((originalIdx, newIdx) => {
-    const wp = waypoints[originalIdx];
-    return {
-      ...wp,
+  // Step 3: Build simplified list. Kept waypoints are copied field by field
+  // (the same shape the generators create) rather than spread, and the
+  // caller's waypoints are left untouched.
+  const simplifiedCount = sortedIndices.length;
+  const simplified: Waypoint[] = new Array(simplifiedCount);
+  for (let newIdx = 0; newIdx < simplifiedCount; newIdx++) {
+    const wp = waypoints[sortedIndices[newIdx]];
+    simplified[newIdx] = {
       index: newIdx,
+      longitude: wp.longitude,
+      latitude: wp.latitude,
+      altitude: wp.altitude,
+      heading: wp.heading,
+      gimbal_pitch: wp.gimbal_pitch,
+      speed: wp.speed,
+      take_photo: wp.take_photo,
     };
-  });
+  }
 
   const originalCount = waypoints.length;
-  const simplifiedCount = simplified.length;
   const reduction = originalCount > 0
     ? ((originalCount - simplifiedCount) / originalCount) * 100
     : 0;
@@ -3,8 +3,8 @@
  */
 
 import { describe, it, expect } from 'vitest';
-import { WPMLBuilder } from './wpmlBuilder';
-import type { Waypoint } from '../../types';
+import { WPMLBuilder, escapeXml } from './wpmlBuilder';
+import type { Waypoint, FinishAction } from '../../types';
 
 // Helper to create a waypoint
 const createWaypoint = (
@@ -43,14 +43,29 @@ describe('WPMLBuilder', () => {
       expect(kml).toContain('<wpml:droneEnumValue>91</wpml:droneEnumValue>');
     });
 
-    it('should use correct drone enum for different models', () => {
-      const waypoints = [createWaypoint(0, -74.07, 4.71)];
+    it.each([
+      ['mini_4_pro', 91],
+      ['mini_5_pro', 100],
+    ] as const)('should use the %s drone enum in both files', (droneModel, enumValue) => {
+      const builder = new WPMLBuilder(droneModel, [createWaypoint(0, -74.07, 4.71)]);
+      const expected = `<wpml:droneEnumValue>${enumValue}</wpml:droneEnumValue>`;
+
+      expect(builder.buildTemplateKml()).toContain(expected);
+      expect(builder.buildWaylinesWpml()).toContain(expected);
+    });
+  });
+
+  describe('escapeXml', () => {
+    it('should escape XML special characters', () => {
+      expect(escapeXml(`Lote 3 & 4 <"norte">'`)).toBe('Lote 3 &amp; 4 &lt;&quot;norte&quot;&gt;&apos;');
+      expect(escapeXml('goHome')).toBe('goHome');
+    });
 
-      const builder4Pro = new WPMLBuilder('mini_4_pro', waypoints);
-      const builder5Pro = new WPMLBuilder('mini_5_pro', waypoints);
+    it('should escape finish action values written into template KML', () => {
+      const builder = new WPMLBuilder('mini_4_pro', [createWaypoint(0, -74.07, 4.71)]);
+      const kml = builder.buildTemplateKml('a<b' as unknown as FinishAction);
 
-      expect(builder4Pro.buildTemplateKml()).toContain('<wpml:droneEnumValue>91</wpml:droneEnumValue>');
-      expect(builder5Pro.buildTemplateKml()).toContain('<wpml:droneEnumValue>100</wpml:droneEnumValue>');
+      expect(kml).toContain('<wpml:finishAction>a&lt;b</wpml:finishAction>');
     });
   });
 
@@ -72,6 +87,31 @@ describe('WPMLBuilder', () => {
       expect(wpml).toContain('<wpml:index>2</wpml:index>');
     });
 
+    it('should declare the namespaces once, on the root element', () => {
+      const waypoints = [
+        createWaypoint(0, -74.07, 4.71),
+        createWaypoint(1, -74.07, 4.72),
+      ];
+
+      const wpml = new WPMLBuilder('mini_4_pro', waypoints).buildWaylinesWpml();
+
+      expect(wpml).toContain('<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:wpml="http://www.uav.com/wpmz/1.0.2">');
+      expect((wpml.match(/xmlns/g) || []).length).toBe(2);
+      expect(wpml).not.toMatch(/ns\d+:/);
+    });
+
+    it('should write coordinates with 7 decimal places', () => {
+      const waypoints = [
+        createWaypoint(0, -74.07123456789, 4.71),
+        createWaypoint(1, -74.07, 4.72000004),
+      ];
+
+      const wpml = new WPMLBuilder('mini_4_pro', waypoints).buildWaylinesWpml();
+
+      expect(wpml).toContain('-74.0712346,4.7100000');
+      expect(wpml).toContain('-74.0700000,4.7200000');
+    });
+
     it('should have takePhoto action only on first waypoint', () => {
       const waypoints = [
         createWaypoint(0, -74.07, 4.71),
@@ -143,6 +183,34 @@ describe('WPMLBuilder', () => {
     });
   });
 
+  describe('buildWaylinesWpmlBytes', () => {
+    it('should return the UTF-8 encoding of buildWaylinesWpml', () => {
+      const waypoints = [
+        createWaypoint(0, -74.07, 4.71),
+        createWaypoint(1, -74.07, 4.72),
+      ];
+
+      const builder = new WPMLBuilder('mini_4_pro', waypoints);
+      const bytes = builder.buildWaylinesWpmlBytes(-60);
+
+      expect(bytes).toBeInstanceOf(Uint8Array);
+      expect(new TextDecoder().decode(bytes)).toBe(builder.buildWaylinesWpml(-60));
+    });
+
+    it('should reuse the encoded file only for the same default pitch', () => {
+      const waypoints = [
+        createWaypoint(0, -74.07, 4.71),
+        createWaypoint(1, -74.07, 4.72),
+      ];
+
+      const builder = new WPMLBuilder('mini_4_pro', waypoints);
+      const bytes = builder.buildWaylinesWpmlBytes(-60);
+
+      expect(builder.buildWaylinesWpmlBytes(-60)).toBe(bytes);
+      expect(builder.buildWaylinesWpmlBytes(-45)).not.toBe(bytes);
+    });
+  });
+
   describe('per-waypoint gimbal pitch', () => {
     it('should use individual gimbal pitch per waypoint for orbit patterns', () => {
       // Simulate orbit pattern with varying gimbal pitches
@@ -1,6 +1,9 @@
 /**
  * WPML XML generator for DJI missions - Compatible with DJI Fly WPML format.
  * Port of backend/app/wpml_builder.py
+ *
+ * The XML is written already indented from string templates, so there is no
+ * tree to serialize and no reparse/pretty-print pass afterwards.
  */
 
 import type { Waypoint, DroneModel, FinishAction, CameraSpec } from '../../types';
@@ -38,10 +41,184 @@ const DEFAULT_GIMBAL_PARAMS: GimbalRotateParams = {
 const WPML_NAMESPACE = 'http://www.uav.com/wpmz/1.0.2';
 const KML_NAMESPACE = 'http://www.opengis.net/kml/2.2';
 
+// Decimal places written for waypoint coordinates: 1e-7 degrees is ~1 cm,
+// finer than the drone's positioning, and keeps the XML compact
+const COORDINATE_DECIMALS = 7;
+
+// Document prefix shared by template.kml and waylines.wpml, built once
+const DOCUMENT_HEADER = `<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="${KML_NAMESPACE}" xmlns:wpml="${WPML_NAMESPACE}">
+  <Document>`;
+
+// Invariant placemark/action fragments, built once at module load. Only the
+// per-waypoint values (coordinates, index, height, speed, action IDs, pitch)
+// are written between them.
+// NOTE: DJI Fly RC2 requires specific values:
+// - waypointHeadingAngle must be 0 when using followWayline mode
+// - useStraightLine must be 0
+// - waypointGimbalPitchAngle must be 0
+const placemarkParams = (headingAngleEnable: number, turnMode: string): string => `</wpml:waypointSpeed>
+        <wpml:waypointHeadingParam>
+          <wpml:waypointHeadingMode>followWayline</wpml:waypointHeadingMode>
+          <wpml:waypointHeadingAngle>0</wpml:waypointHeadingAngle>
+          <wpml:waypointPoiPoint>0.000000,0.000000,0.000000</wpml:waypointPoiPoint>
+          <wpml:waypointHeadingAngleEnable>${headingAngleEnable}</wpml:waypointHeadingAngleEnable>
+          <wpml:waypointHeadingPathMode>followBadArc</wpml:waypointHeadingPathMode>
+          <wpml:waypointHeadingPoiIndex>0</wpml:waypointHeadingPoiIndex>
+        </wpml:waypointHeadingParam>
+        <wpml:waypointTurnParam>
+          <wpml:waypointTurnMode>${turnMode}</wpml:waypointTurnMode>
+          <wpml:waypointTurnDampingDist>0</wpml:waypointTurnDampingDist>
+        </wpml:waypointTurnParam>
+        <wpml:useStraightLine>0</wpml:useStraightLine>`;
+
+// First/last waypoints stop with heading enabled; the rest pass through
+const PLACEMARK_PARAMS_STOP = placemarkParams(1, 'toPointAndStopWithContinuityCurvature');
+const PLACEMARK_PARAMS_PASS = placemarkParams(0, 'toPointAndPassWithContinuityCurvature');
+
+const PLACEMARK_CLOSE = `
+        <wpml:waypointGimbalHeadingParam>
+          <wpml:waypointGimbalPitchAngle>0</wpml:waypointGimbalPitchAngle>
+          <wpml:waypointGimbalYawAngle>0</wpml:waypointGimbalYawAngle>
+        </wpml:waypointGimbalHeadingParam>
+      </Placemark>`;
+
+// Action groups all run in parallel and trigger on reaching the waypoint
+const ACTION_GROUP_OPEN = `        <wpml:actionGroup>
+          <wpml:actionGroupId>`;
+
+const ACTION_GROUP_START_INDEX = `</wpml:actionGroupId>
+          <wpml:actionGroupStartIndex>`;
+
+const ACTION_GROUP_END_INDEX = `</wpml:actionGroupStartIndex>
+          <wpml:actionGroupEndIndex>`;
+
+const ACTION_GROUP_TRIGGER = `</wpml:actionGroupEndIndex>
+          <wpml:actionGroupMode>parallel</wpml:actionGroupMode>
+          <wpml:actionTrigger>
+            <wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
+          </wpml:actionTrigger>
+`;
+
+const ACTION_GROUP_CLOSE = `
+        </wpml:actionGroup>`;
+
+const ACTION_OPEN = `          <wpml:action>
+            <wpml:actionId>`;
+
+const TAKE_PHOTO_REST = `</wpml:actionId>
+            <wpml:actionActuatorFunc>takePhoto</wpml:actionActuatorFunc>
+            <wpml:actionActuatorFuncParam>
+              <wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
+              <wpml:useGlobalPayloadLensIndex>0</wpml:useGlobalPayloadLensIndex>
+            </wpml:actionActuatorFuncParam>
+          </wpml:action>`;
+
+// gimbalRotate uses the default parameters; only the pitch varies, so the
+// parameters before and after it are baked into two fragments
+const GIMBAL_ROTATE_PITCH = `</wpml:actionId>
+            <wpml:actionActuatorFunc>gimbalRotate</wpml:actionActuatorFunc>
+            <wpml:actionActuatorFuncParam>
+              <wpml:gimbalHeadingYawBase>${DEFAULT_GIMBAL_PARAMS.gimbalHeadingYawBase}</wpml:gimbalHeadingYawBase>
+              <wpml:gimbalRotateMode>${DEFAULT_GIMBAL_PARAMS.gimbalRotateMode}</wpml:gimbalRotateMode>
+              <wpml:gimbalPitchRotateEnable>${DEFAULT_GIMBAL_PARAMS.gimbalPitchRotateEnable}</wpml:gimbalPitchRotateEnable>
+              <wpml:gimbalPitchRotateAngle>`;
+
+const GIMBAL_ROTATE_REST = `</wpml:gimbalPitchRotateAngle>
+              <wpml:gimbalRollRotateEnable>${DEFAULT_GIMBAL_PARAMS.gimbalRollRotateEnable}</wpml:gimbalRollRotateEnable>
+              <wpml:gimbalRollRotateAngle>${Math.floor(DEFAULT_GIMBAL_PARAMS.gimbalRollRotateAngle)}</wpml:gimbalRollRotateAngle>
+              <wpml:gimbalYawRotateEnable>${DEFAULT_GIMBAL_PARAMS.gimbalYawRotateEnable}</wpml:gimbalYawRotateEnable>
+              <wpml:gimbalYawRotateAngle>${Math.floor(DEFAULT_GIMBAL_PARAMS.gimbalYawRotateAngle)}</wpml:gimbalYawRotateAngle>
+              <wpml:gimbalRotateTimeEnable>${DEFAULT_GIMBAL_PARAMS.gimbalRotateTimeEnable}</wpml:gimbalRotateTimeEnable>
+              <wpml:gimbalRotateTime>${Math.floor(DEFAULT_GIMBAL_PARAMS.gimbalRotateTime)}</wpml:gimbalRotateTime>
+              <wpml:payloadPositionIndex>${DEFAULT_GIMBAL_PARAMS.payloadPositionIndex}</wpml:payloadPositionIndex>
+            </wpml:actionActuatorFuncParam>
+          </wpml:action>`;
+
+const EVENLY_ROTATE_PITCH = `</wpml:actionId>
+            <wpml:actionActuatorFunc>gimbalEvenlyRotate</wpml:actionActuatorFunc>
+            <wpml:actionActuatorFuncParam>
+              <wpml:gimbalPitchRotateAngle>`;
+
+const EVENLY_ROTATE_REST = `</wpml:gimbalPitchRotateAngle>
+              <wpml:gimbalRollRotateAngle>0</wpml:gimbalRollRotateAngle>
+              <wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
+            </wpml:actionActuatorFuncParam>
+          </wpml:action>`;
+
+const textEncoder = new TextEncoder();
+
+const XML_ESCAPES: Record<string, string> = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&apos;',
+};
+// All special characters are escaped in one pass of a single compiled pattern
+const XML_SPECIAL_CHARS = /[&<>"']/g;
+const XML_SPECIAL_CHAR = /[&<>"']/;
+
+/**
+ * missionConfig block shared by template.kml and waylines.wpml.
+ * finishAction must already be XML-escaped.
+ */
+function missionConfigXml(finishAction: string, speed: number, droneEnumValue: number): string {
+  return `    <wpml:missionConfig>
+      <wpml:flyToWaylineMode>safely</wpml:flyToWaylineMode>
+      <wpml:finishAction>${finishAction}</wpml:finishAction>
+      <wpml:exitOnRCLost>executeLostAction</wpml:exitOnRCLost>
+      <wpml:executeRCLostAction>goBack</wpml:executeRCLostAction>
+      <wpml:globalTransitionalSpeed>${speed}</wpml:globalTransitionalSpeed>
+      <wpml:droneInfo>
+        <wpml:droneEnumValue>${droneEnumValue}</wpml:droneEnumValue>
+        <wpml:droneSubEnumValue>0</wpml:droneSubEnumValue>
+      </wpml:droneInfo>
+    </wpml:missionConfig>`;
+}
+
+/**
+ * UTF-8 encode a list of fragments straight into one buffer, without joining
+ * them into an intermediate string first. WPML is ASCII, so the buffer is sized
+ * at one byte per UTF-16 code unit; if non-ASCII text overflows it, the
+ * fragments are joined and encoded in one go instead.
+ */
+function encodeFragments(fragments: string[]): Uint8Array {
+  let length = 0;
+  for (let i = 0; i < fragments.length; i++) length += fragments[i].length;
+
+  const bytes = new Uint8Array(length);
+  let offset = 0;
+  for (let i = 0; i < fragments.length; i++) {
+    const { read, written } = textEncoder.encodeInto(fragments[i], bytes.subarray(offset));
+    if (read < fragments[i].length) {
+      return textEncoder.encode(fragments.join(''));
+    }
+    offset += written;
+  }
+  return offset === length ? bytes : bytes.subarray(0, offset);
+}
+
+/**
+ * Escape a text value for use inside an XML element.
+ * Values that arrive from the main thread are only typed at compile time, so
+ * free-form strings are escaped before they are written into the templates.
+ */
+export function escapeXml(value: string): string {
+  // Most values have nothing to escape: skip the replace pass for them
+  return XML_SPECIAL_CHAR.test(value)
+    ? value.replace(XML_SPECIAL_CHARS, ch => XML_ESCAPES[ch])
+    : value;
+}
+
 export class WPMLBuilder {
   private camera: CameraSpec;
   private waypoints: Waypoint[];
-  private actionIdCounter: number = 1;
+  // Mission speed (first waypoint's), shared by template.kml and waylines.wpml
+  private speed: number;
+  // Last encoded waylines.wpml; it does not depend on the finish action, so
+  // repeated KMZ exports of the same builder encode it only once
+  private waylinesBytes: { defaultGimbalPitch: number; bytes: Uint8Array } | null = null;
 
   constructor(
     droneModel: DroneModel,
@@ -50,6 +227,7 @@ export class WPMLBuilder {
   ) {
     this.camera = CAMERA_PRESETS[droneModel];
     this.waypoints = waypoints;
+    this.speed = waypoints[0]?.speed ?? 5.0;
   }
 
   /**
@@ -59,25 +237,14 @@ export class WPMLBuilder {
    */
   buildTemplateKml(finishAction: FinishAction = 'goHome'): string {
     const timestamp = Date.now();
-    const speed = this.waypoints[0]?.speed ?? 5.0;
+    const speed = this.speed;
+    const finishActionXml = escapeXml(String(finishAction));
 
-    return `<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="${KML_NAMESPACE}" xmlns:wpml="${WPML_NAMESPACE}">
-  <Document>
+    return `${DOCUMENT_HEADER}
     <wpml:author>GeoFlight Planner</wpml:author>
     <wpml:createTime>${timestamp}</wpml:createTime>
     <wpml:updateTime>${timestamp}</wpml:updateTime>
-    <wpml:missionConfig>
-      <wpml:flyToWaylineMode>safely</wpml:flyToWaylineMode>
-      <wpml:finishAction>${finishAction}</wpml:finishAction>
-      <wpml:exitOnRCLost>executeLostAction</wpml:exitOnRCLost>
-      <wpml:executeRCLostAction>goBack</wpml:executeRCLostAction>
-      <wpml:globalTransitionalSpeed>${speed}</wpml:globalTransitionalSpeed>
-      <wpml:droneInfo>
-        <wpml:droneEnumValue>${this.camera.drone_enum_value}</wpml:droneEnumValue>
-        <wpml:droneSubEnumValue>0</wpml:droneSubEnumValue>
-      </wpml:droneInfo>
-    </wpml:missionConfig>
+${missionConfigXml(finishActionXml, speed, this.camera.drone_enum_value)}
   </Document>
 </kml>
 `;
@@ -91,229 +258,194 @@ export class WPMLBuilder {
    * The defaultGimbalPitch is only used if a waypoint doesn't have one set.
    */
   buildWaylinesWpml(defaultGimbalPitch: number = -90): string {
-    if (this.waypoints.length === 0) {
+    return this.writeWaylinesWpml(defaultGimbalPitch).join('');
+  }
+
+  /**
+   * Write the waylines.wpml fragments, in order, into a fresh buffer.
+   */
+  private writeWaylinesWpml(defaultGimbalPitch: number): string[] {
+    // Hoist the fields read on every iteration into locals
+    const waypoints = this.waypoints;
+    const n = waypoints.length;
+    if (n === 0) {
       throw new Error('No waypoints provided');
     }
 
-    // Reset action ID counter for each generation
-    this.actionIdCounter = 1;
+    // Action IDs restart at 1 for each generation; the counter is a local
+    // threaded through the placemark writer rather than instance state
+    let actionId = 1;
 
-    const speed = this.waypoints[0]?.speed ?? 5.0;
+    const speed = this.speed;
 
-    // Generate mission config
-    const missionConfig = this.generateMissionConfig();
+    // All fragments are appended to one buffer and joined (or encoded) once at
+    // the end, instead of building and re-concatenating a string per placemark
+    const out: string[] = [];
+    out.push(DOCUMENT_HEADER, '\n');
+    // The selected finish action is carried by template.kml; waylines keeps goHome
+    out.push(missionConfigXml('goHome', speed, this.camera.drone_enum_value));
+    out.push(`
+    <Folder>
+      <wpml:templateId>0</wpml:templateId>
+      <wpml:executeHeightMode>relativeToStartPoint</wpml:executeHeightMode>
+      <wpml:waylineId>0</wpml:waylineId>
+      <wpml:distance>0</wpml:distance>
+      <wpml:duration>0</wpml:duration>
+      <wpml:autoFlightSpeed>${speed}</wpml:autoFlightSpeed>
+`);
 
-    // Generate all placemarks - each waypoint uses its own gimbal_pitch
-    const placemarks: string[] = [];
-    for (let i = 0; i < this.waypoints.length; i++) {
-      const wp = this.waypoints[i];
+    // Write all placemarks - each waypoint uses its own gimbal_pitch
+    for (let i = 0; i < n; i++) {
+      const wp = waypoints[i];
       const isFirst = i === 0;
-      const isLast = i === this.waypoints.length - 1;
+      const isLast = i === n - 1;
       // Use waypoint's individual gimbal_pitch, fallback to default
       const wpGimbalPitch = wp.gimbal_pitch ?? defaultGimbalPitch;
       // For gimbalEvenlyRotate, we need the NEXT waypoint's pitch (transition target)
-      const nextWp = i < this.waypoints.length - 1 ? this.waypoints[i + 1] : null;
+      const nextWp = isLast ? null : waypoints[i + 1];
       const nextGimbalPitch = nextWp?.gimbal_pitch ?? wpGimbalPitch;
-      placemarks.push(this.generatePlacemark(wp, isFirst, isLast, wpGimbalPitch, nextGimbalPitch));
+      if (!isFirst) {
+        out.push('\n');
+      }
+      actionId = this.writePlacemark(out, wp, isFirst, isLast, actionId, wpGimbalPitch, nextGimbalPitch);
     }
 
-    const placemarksXml = placemarks.join('\n');
-
-    return `<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="${KML_NAMESPACE}" xmlns:wpml="${WPML_NAMESPACE}">
-  <Document>
-${missionConfig}
-    <Folder>
-      <wpml:templateId>0</wpml:templateId>
-      <wpml:executeHeightMode>relativeToStartPoint</wpml:executeHeightMode>
-      <wpml:waylineId>0</wpml:waylineId>
-      <wpml:distance>0</wpml:distance>
-      <wpml:duration>0</wpml:duration>
-      <wpml:autoFlightSpeed>${speed}</wpml:autoFlightSpeed>
-${placemarksXml}
+    out.push(`
     </Folder>
   </Document>
 </kml>
-`;
+`);
+    return out;
   }
 
-  private generateMissionConfig(): string {
-    const speed = this.waypoints[0]?.speed ?? 5.0;
+  /**
+   * template.kml content, UTF-8 encoded (ready to store in the KMZ).
+   */
+  buildTemplateKmlBytes(finishAction: FinishAction = 'goHome'): Uint8Array {
+    return textEncoder.encode(this.buildTemplateKml(finishAction));
+  }
 
-    return `    <wpml:missionConfig>
-      <wpml:flyToWaylineMode>safely</wpml:flyToWaylineMode>
-      <wpml:finishAction>goHome</wpml:finishAction>
-      <wpml:exitOnRCLost>executeLostAction</wpml:exitOnRCLost>
-      <wpml:executeRCLostAction>goBack</wpml:executeRCLostAction>
-      <wpml:globalTransitionalSpeed>${speed}</wpml:globalTransitionalSpeed>
-      <wpml:droneInfo>
-        <wpml:droneEnumValue>${this.camera.drone_enum_value}</wpml:droneEnumValue>
-        <wpml:droneSubEnumValue>0</wpml:droneSubEnumValue>
-      </wpml:droneInfo>
-    </wpml:missionConfig>`;
+  /**
+   * waylines.wpml content, UTF-8 encoded (ready to store in the KMZ).
+   * The waypoints are treated as immutable once handed to the builder, so the
+   * encoded file is reused across calls with the same default pitch.
+   */
+  buildWaylinesWpmlBytes(defaultGimbalPitch: number = -90): Uint8Array {
+    if (this.waylinesBytes?.defaultGimbalPitch === defaultGimbalPitch) {
+      return this.waylinesBytes.bytes;
+    }
+    const bytes = encodeFragments(this.writeWaylinesWpml(defaultGimbalPitch));
+    this.waylinesBytes = { defaultGimbalPitch, bytes };
+    return bytes;
   }
 
-  private generatePlacemark(
+  /**
+   * Write one placemark, numbering its actions from actionId.
+   * Returns the next free action ID.
+   */
+  private writePlacemark(
+    out: string[],
     wp: Waypoint,
     isFirst: boolean,
     isLast: boolean,
+    actionId: number,
     gimbalPitch: number,
     nextGimbalPitch?: number
-  ): string {
+  ): number {
     // For gimbalEvenlyRotate: use next waypoint's pitch as transition target
     const transitionPitch = nextGimbalPitch ?? gimbalPitch;
-    // Determine turn mode and heading enable based on position
-    let turnMode: string;
-    let headingAngleEnable: number;
-
-    if (isFirst || isLast) {
-      turnMode = 'toPointAndStopWithContinuityCurvature';
-      headingAngleEnable = 1;
-    } else {
-      turnMode = 'toPointAndPassWithContinuityCurvature';
-      headingAngleEnable = 0;
-    }
+    // Read each waypoint field once; index is reused by every action group
+    const index = wp.index;
 
-    // Base placemark structure
-    // NOTE: DJI Fly RC2 requires specific values:
-    // - executeHeight must be integer
-    // - waypointHeadingAngle must be 0 when using followWayline mode
-    // - useStraightLine must be 0
-    let placemarkXml = `      <Placemark>
+    // Base placemark structure (executeHeight must be integer for DJI Fly RC2)
+    out.push(
+      `      <Placemark>
         <Point>
           <coordinates>
-            ${wp.longitude},${wp.latitude}
+            ${wp.longitude.toFixed(COORDINATE_DECIMALS)},${wp.latitude.toFixed(COORDINATE_DECIMALS)}
           </coordinates>
         </Point>
-        <wpml:index>${wp.index}</wpml:index>
+        <wpml:index>${index}</wpml:index>
         <wpml:executeHeight>${Math.floor(wp.altitude)}</wpml:executeHeight>
-        <wpml:waypointSpeed>${wp.speed}</wpml:waypointSpeed>
-        <wpml:waypointHeadingParam>
-          <wpml:waypointHeadingMode>followWayline</wpml:waypointHeadingMode>
-          <wpml:waypointHeadingAngle>0</wpml:waypointHeadingAngle>
-          <wpml:waypointPoiPoint>0.000000,0.000000,0.000000</wpml:waypointPoiPoint>
-          <wpml:waypointHeadingAngleEnable>${headingAngleEnable}</wpml:waypointHeadingAngleEnable>
-          <wpml:waypointHeadingPathMode>followBadArc</wpml:waypointHeadingPathMode>
-          <wpml:waypointHeadingPoiIndex>0</wpml:waypointHeadingPoiIndex>
-        </wpml:waypointHeadingParam>
-        <wpml:waypointTurnParam>
-          <wpml:waypointTurnMode>${turnMode}</wpml:waypointTurnMode>
-          <wpml:waypointTurnDampingDist>0</wpml:waypointTurnDampingDist>
-        </wpml:waypointTurnParam>
-        <wpml:useStraightLine>0</wpml:useStraightLine>`;
+        <wpml:waypointSpeed>${wp.speed}`,
+      isFirst || isLast ? PLACEMARK_PARAMS_STOP : PLACEMARK_PARAMS_PASS
+    );
 
     // Add action groups
     // NOTE: Based on DJI Fly RC2 analysis:
     // - takePhoto ONLY on first waypoint
     // - gimbalRotate ONLY on first waypoint
     // - gimbalEvenlyRotate on ALL waypoints except the last one
-    const actionGroups: string[] = [];
-
     if (isFirst) {
       // First waypoint: takePhoto + gimbalRotate (set initial gimbal position)
-      const gimbalParams: GimbalRotateParams = {
-        ...DEFAULT_GIMBAL_PARAMS,
-        gimbalPitchRotateAngle: gimbalPitch,
-      };
-      const actions = [
-        this.generateActionTakePhoto(),
-        this.generateActionGimbalRotate(gimbalParams),
-      ];
-      actionGroups.push(this.generateActionGroup(1, wp.index, wp.index, actions));
-
-      // Add gimbalEvenlyRotate for transition to next waypoint (uses next wp's pitch)
-      if (this.waypoints.length > 1) {
-        const actions2 = [this.generateActionGimbalEvenlyRotate(transitionPitch)];
-        actionGroups.push(this.generateActionGroup(2, wp.index, wp.index + 1, actions2));
-      }
-    } else if (!isLast) {
-      // Intermediate waypoints: gimbalEvenlyRotate for smooth transition to next waypoint
-      const actions = [this.generateActionGimbalEvenlyRotate(transitionPitch)];
-      actionGroups.push(this.generateActionGroup(2, wp.index, wp.index + 1, actions));
+      out.push('\n');
+      this.writeActionGroupStart(out, 1, index, index);
+      this.writeActionTakePhoto(out, actionId++);
+      out.push('\n');
+      this.writeActionGimbalRotate(out, actionId++, gimbalPitch);
+      this.writeActionGroupEnd(out);
     }
-    // Last waypoint: NO action groups (as seen in DJI file)
-
-    // Add action groups to XML
-    if (actionGroups.length > 0) {
-      placemarkXml += '\n' + actionGroups.join('\n');
+    if (!isLast) {
+      // Every waypoint but the last: gimbalEvenlyRotate for a smooth transition
+      // to the next waypoint (uses next wp's pitch)
+      out.push('\n');
+      this.writeActionGroupStart(out, 2, index, index + 1);
+      this.writeActionGimbalEvenlyRotate(out, actionId++, transitionPitch);
+      this.writeActionGroupEnd(out);
     }
+    // Last waypoint: NO action groups (as seen in DJI file)
 
     // Close placemark with gimbal heading param
-    // NOTE: waypointGimbalPitchAngle must be 0 for DJI Fly RC2 compatibility
-    placemarkXml += `
-        <wpml:waypointGimbalHeadingParam>
-          <wpml:waypointGimbalPitchAngle>0</wpml:waypointGimbalPitchAngle>
-          <wpml:waypointGimbalYawAngle>0</wpml:waypointGimbalYawAngle>
-        </wpml:waypointGimbalHeadingParam>
-      </Placemark>`;
-
-    return placemarkXml;
+    out.push(PLACEMARK_CLOSE);
+    return actionId;
   }
 
-  private generateActionTakePhoto(): string {
-    const actionId = this.actionIdCounter++;
-    return `          <wpml:action>
-            <wpml:actionId>${actionId}</wpml:actionId>
-            <wpml:actionActuatorFunc>takePhoto</wpml:actionActuatorFunc>
-            <wpml:actionActuatorFuncParam>
-              <wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
-              <wpml:useGlobalPayloadLensIndex>0</wpml:useGlobalPayloadLensIndex>
-            </wpml:actionActuatorFuncParam>
-          </wpml:action>`;
+  private writeActionTakePhoto(out: string[], actionId: number): void {
+    out.push(ACTION_OPEN, String(actionId), TAKE_PHOTO_REST);
   }
 
-  private generateActionGimbalRotate(params: GimbalRotateParams): string {
-    const actionId = this.actionIdCounter++;
-    return `          <wpml:action>
-            <wpml:actionId>${actionId}</wpml:actionId>
-            <wpml:actionActuatorFunc>gimbalRotate</wpml:actionActuatorFunc>
-            <wpml:actionActuatorFuncParam>
-              <wpml:gimbalHeadingYawBase>${params.gimbalHeadingYawBase}</wpml:gimbalHeadingYawBase>
-              <wpml:gimbalRotateMode>${params.gimbalRotateMode}</wpml:gimbalRotateMode>
-              <wpml:gimbalPitchRotateEnable>${params.gimbalPitchRotateEnable}</wpml:gimbalPitchRotateEnable>
-              <wpml:gimbalPitchRotateAngle>${Math.floor(params.gimbalPitchRotateAngle)}</wpml:gimbalPitchRotateAngle>
-              <wpml:gimbalRollRotateEnable>${params.gimbalRollRotateEnable}</wpml:gimbalRollRotateEnable>
-              <wpml:gimbalRollRotateAngle>${Math.floor(params.gimbalRollRotateAngle)}</wpml:gimbalRollRotateAngle>
-              <wpml:gimbalYawRotateEnable>${params.gimbalYawRotateEnable}</wpml:gimbalYawRotateEnable>
-              <wpml:gimbalYawRotateAngle>${Math.floor(params.gimbalYawRotateAngle)}</wpml:gimbalYawRotateAngle>
-              <wpml:gimbalRotateTimeEnable>${params.gimbalRotateTimeEnable}</wpml:gimbalRotateTimeEnable>
-              <wpml:gimbalRotateTime>${Math.floor(params.gimbalRotateTime)}</wpml:gimbalRotateTime>
-              <wpml:payloadPositionIndex>${params.payloadPositionIndex}</wpml:payloadPositionIndex>
-            </wpml:actionActuatorFuncParam>
-          </wpml:action>`;
+  private writeActionGimbalRotate(out: string[], actionId: number, gimbalPitch: number): void {
+    out.push(
+      ACTION_OPEN,
+      String(actionId),
+      GIMBAL_ROTATE_PITCH,
+      String(Math.floor(gimbalPitch)),
+      GIMBAL_ROTATE_REST
+    );
   }
 
-  private generateActionGimbalEvenlyRotate(gimbalPitch: number = -90): string {
-    const actionId = this.actionIdCounter++;
-    return `          <wpml:action>
-            <wpml:actionId>${actionId}</wpml:actionId>
-            <wpml:actionActuatorFunc>gimbalEvenlyRotate</wpml:actionActuatorFunc>
-            <wpml:actionActuatorFuncParam>
-              <wpml:gimbalPitchRotateAngle>${Math.floor(gimbalPitch)}</wpml:gimbalPitchRotateAngle>
-              <wpml:gimbalRollRotateAngle>0</wpml:gimbalRollRotateAngle>
-              <wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
-            </wpml:actionActuatorFuncParam>
-          </wpml:action>`;
+  private writeActionGimbalEvenlyRotate(out: string[], actionId: number, gimbalPitch: number = -90): void {
+    out.push(
+      ACTION_OPEN,
+      String(actionId),
+      EVENLY_ROTATE_PITCH,
+      String(Math.floor(gimbalPitch)),
+      EVENLY_ROTATE_REST
+    );
   }
 
-  private generateActionGroup(
+  /**
+   * Open an action group; its actions are written next (newline-separated),
+   * followed by writeActionGroupEnd.
+   */
+  private writeActionGroupStart(
+    out: string[],
     groupId: number,
     startIndex: number,
-    endIndex: number,
-    actions: string[],
-    mode: string = 'parallel',
-    triggerType: string = 'reachPoint'
-  ): string {
-    const actionsXml = actions.join('\n');
-    return `        <wpml:actionGroup>
-          <wpml:actionGroupId>${groupId}</wpml:actionGroupId>
-          <wpml:actionGroupStartIndex>${startIndex}</wpml:actionGroupStartIndex>
-          <wpml:actionGroupEndIndex>${endIndex}</wpml:actionGroupEndIndex>
-          <wpml:actionGroupMode>${mode}</wpml:actionGroupMode>
-          <wpml:actionTrigger>
-            <wpml:actionTriggerType>${triggerType}</wpml:actionTriggerType>
-          </wpml:actionTrigger>
-${actionsXml}
-        </wpml:actionGroup>`;
+    endIndex: number
+  ): void {
+    out.push(
+      ACTION_GROUP_OPEN,
+      String(groupId),
+      ACTION_GROUP_START_INDEX,
+      String(startIndex),
+      ACTION_GROUP_END_INDEX,
+      String(endIndex),
+      ACTION_GROUP_TRIGGER
+    );
+  }
+
+  private writeActionGroupEnd(out: string[]): void {
+    out.push(ACTION_GROUP_CLOSE);
   }
 }